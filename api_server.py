@@ -7,15 +7,19 @@ Now supports multi-tenant user authentication with JWT tokens.
 """
 
 import csv
-import json
 import os
 import sys
+import threading
 import time
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import wraps
-from io import StringIO
-from flask import Flask, jsonify, request, g
+from io import StringIO, TextIOWrapper
+from itertools import islice
+import orjson
+from flask import Flask, Response, jsonify, request, g, stream_with_context
 from flask_cors import CORS
 
 # Add the project to path
@@ -38,9 +42,11 @@ from outreach_proj.auth import (
 
 # Import service helpers
 from outreach_proj.api_helpers import (
+    OrjsonProvider,
     get_contact_service,
     get_template_service,
     get_email_service,
+    close_request_db,
 )
 
 # Legacy imports (for backwards compatibility during migration)
@@ -48,7 +54,6 @@ from outreach_proj.outreach import (
     load_config,
     load_contacts,
     load_contacted_emails,
-    append_log,
     save_draft,
     DEFAULT_CONFIG_FILE,
     DEFAULT_CONTACTS_FILE,
@@ -57,8 +62,14 @@ from outreach_proj.outreach import (
 )
 from outreach_proj.generate_email import generate_personalized_email
 from outreach_proj.send_email import get_gmail_service, create_message, send_message
+from googleapiclient.errors import HttpError
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# The service context managers park their shared session on g; close it
+# once the request is done rather than per context-manager exit
+app.teardown_appcontext(close_request_db)
 
 # Initialize database on startup
 init_db()
@@ -66,34 +77,293 @@ init_db()
 # CORS Configuration
 CORS(app, origins=config.ALLOWED_ORIGINS, supports_credentials=True)
 
-# Rate limiting cache (per IP)
-rate_limit_cache = {}
+# Rate limiting cache (per IP) - sliding-window bucket counters: the window
+# is split into fixed sub-buckets and each IP stores six (stamp, count)
+# slots, so memory per IP is constant regardless of request volume
+_RATE_LIMIT_BUCKETS = 6
+_RATE_LIMIT_BUCKET_LEN = max(1, config.RATE_LIMIT_WINDOW // _RATE_LIMIT_BUCKETS)
+rate_limit_cache = defaultdict(
+    lambda: ([0] * _RATE_LIMIT_BUCKETS, [0] * _RATE_LIMIT_BUCKETS)
+)
+# Hard cap on tracked IPs: scanners and spoofed addresses can otherwise
+# grow the cache without bound between sweeps
+_RATE_LIMIT_MAX_IPS = 50000
+_rate_limit_last_sweep = time.time()
+
+# Optional Redis backend for rate limiting. Under multiple workers the
+# in-memory cache gives every process its own budget (N workers = N x the
+# configured limit); a shared rolling-window ZSET enforces it once. The
+# Lua script cleans, counts, adds, and sets expiry in one atomic EVALSHA
+# round trip - register_script caches the SHA client-side.
+_REDIS_RATE_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local max = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) >= max then
+    return 0
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('EXPIRE', key, window)
+return 1
+"""
+_redis_rate_script = None
+if config.REDIS_URL:
+    try:
+        import redis
+        _redis_rate_script = redis.Redis.from_url(config.REDIS_URL).register_script(
+            _REDIS_RATE_LUA
+        )
+    except Exception as e:
+        print(f"[WARN] Redis unavailable, falling back to in-memory rate limiter: {e}")
+
+# Parsed-file cache for the legacy CSV-backed endpoints, keyed by path with
+# (mtime_ns, size) stamps. Contacts and the contacted-email log change rarely
+# but were re-read and re-parsed on every /api/contacts, dry-run and send
+# request; serve the parsed value until the file actually changes on disk.
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+
+
+def _cached_load(path, loader):
+    """Return loader(path), re-running it only when the file changes on disk.
+
+    Keyed by (path, loader) so the same file can back more than one
+    parsed view (the send log feeds both the contacted set and /api/logs).
+    """
+    try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+
+    key = (path, loader)
+    with _file_cache_lock:
+        entry = _file_cache.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+    value = loader(path)
+    with _file_cache_lock:
+        _file_cache[key] = (stamp, value)
+    return value
+
+
+def _invalidate_file_cache(path):
+    """Drop every cached parse of a path after rewriting the file."""
+    with _file_cache_lock:
+        for key in [k for k in _file_cache if k[0] == path]:
+            del _file_cache[key]
+
+
+def _load_contacts_normalized(path):
+    """load_contacts plus a precomputed ``_email_norm`` key per row.
+
+    Every status/dedup/filter check needs the stripped, lowercased email;
+    normalizing once at parse time turns those hot-path computations into
+    a plain dict lookup. save_contacts ignores the extra key on write.
+    """
+    contacts = load_contacts(path)
+    for c in contacts:
+        c["_email_norm"] = c.get("Email Address", "").strip().lower()
+    return contacts
+
+
+def _load_contacted_frozen(path):
+    """load_contacted_emails as a frozenset.
+
+    The cached value is shared across requests, so make accidental
+    in-place mutation impossible.
+    """
+    return frozenset(load_contacted_emails(path))
+
+
+def _get_contacts_cached():
+    """Load contacts, served from the parsed-file cache when unchanged."""
+    return _cached_load(DEFAULT_CONTACTS_FILE, _load_contacts_normalized)
+
+
+def _get_contacted_cached():
+    """Load contacted emails, served from the parsed-file cache when unchanged."""
+    return _cached_load(DEFAULT_LOG_FILE, _load_contacted_frozen)
+
+
+def _get_config():
+    """Load config, served from the parsed-file cache when unchanged.
+
+    save_config swaps the file via os.replace, so the stat stamp flips
+    and the next read re-parses without explicit invalidation.
+    """
+    return _cached_load(DEFAULT_CONFIG_FILE, load_config)
+
+
+def _load_log_rows(path):
+    """Parse the send log into response-shaped rows, oldest first."""
+    rows = []
+    if os.path.exists(path):
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                rows.append({
+                    "timestamp": row.get("Timestamp", ""),
+                    "email": row.get("Email", ""),
+                    "company": row.get("Company", ""),
+                    "status": row.get("Status", ""),
+                    "subject": row.get("Subject", ""),
+                    "error": row.get("Error", "")
+                })
+    return rows
+
+
+# Derived index over the cached contacts list: normalized email -> position.
+# Rebuilt only when the contacts parse itself is refreshed, so duplicate
+# checks and deletes are a hash probe instead of an O(N) scan per request.
+_email_index_cache = (None, None)
+
+
+def _get_contacts_with_index():
+    """Return (contacts, email_index) where the index maps lowered emails
+    to positions in the cached contacts list."""
+    global _email_index_cache
+    contacts = _get_contacts_cached()
+
+    cached_for, index = _email_index_cache
+    if cached_for is contacts:
+        return contacts, index
+
+    index = {}
+    for i, c in enumerate(contacts):
+        email = c["_email_norm"]
+        if email:
+            index[email] = i
+    _email_index_cache = (contacts, index)
+    return contacts, index
+
+
+# Serialized-response cache for the polled legacy GET endpoints, keyed by
+# endpoint with the ETag the bytes were built for. Together with the ETag
+# check this turns a dashboard poll into either a 304 or a cached-bytes
+# send, instead of a CSV parse + JSON encode per request.
+_etag_cache = {}
+
+
+def _stat_etag(*paths):
+    """Build a weak validator from the (mtime_ns, size) of source files."""
+    parts = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            parts.append(f"{st.st_mtime_ns:x}-{st.st_size:x}")
+        except OSError:
+            parts.append("0")
+    return '"' + ".".join(parts) + '"'
+
+
+def _etag_response(key, etag, build):
+    """Return a 304, cached bytes, or freshly built+cached JSON response."""
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304, headers={'ETag': etag})
+
+    cached = _etag_cache.get(key)
+    if cached is not None and cached[0] == etag:
+        body = cached[1]
+    else:
+        body = orjson.dumps(build())
+        _etag_cache[key] = (etag, body)
+    return Response(body, mimetype='application/json', headers={'ETag': etag})
+
+
+# Compiled once at import - validate_email runs on every auth and
+# contact-mutation request, so avoid the re-module cache lookup per call.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 
 def validate_email(email: str) -> bool:
     """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # Cheap structural pre-check: most invalid inputs lack an '@' or a
+    # dotted domain, and these byte scans reject them without entering
+    # the regex engine at all
+    local, sep, domain = email.rpartition('@')
+    if not sep or not local or '.' not in domain:
+        return False
+    return _EMAIL_RE.match(email) is not None
+
+
+def _eligible_contacts(contacts, contacted, require_valid=False):
+    """
+    Yield contacts eligible for processing in a single fused pass.
+
+    Skips rows without an email and drops already-contacted addresses.
+    Used with islice so the scan stops as soon as the requested limit
+    is filled. (Single-email requests bypass this via the email index.)
+    """
+    for c in contacts:
+        lowered = c["_email_norm"]
+        if not lowered:
+            continue
+        if require_valid and not validate_email(lowered):
+            continue
+        if lowered in contacted:
+            continue
+        yield c
 
 
 def rate_limit():
     """Simple in-memory rate limiter."""
+    global _rate_limit_last_sweep
     client_ip = request.remote_addr
     current_time = time.time()
-    
-    if client_ip not in rate_limit_cache:
-        rate_limit_cache[client_ip] = []
-    
-    # Clean old requests
-    rate_limit_cache[client_ip] = [
-        t for t in rate_limit_cache[client_ip] 
-        if current_time - t < config.RATE_LIMIT_WINDOW
-    ]
-    
-    if len(rate_limit_cache[client_ip]) >= config.RATE_LIMIT_MAX_REQUESTS:
+    window = config.RATE_LIMIT_WINDOW
+
+    # Shared rolling window: one atomic EVALSHA round trip. The member is
+    # a nanosecond stamp so simultaneous requests don't collapse into one
+    # ZSET entry; the score is wall-clock seconds, comparable across
+    # workers on different hosts.
+    if _redis_rate_script is not None:
+        try:
+            allowed = _redis_rate_script(
+                keys=[f"rl:{client_ip}"],
+                args=[current_time, window, config.RATE_LIMIT_MAX_REQUESTS, time.time_ns()],
+            )
+            return bool(allowed)
+        except Exception as e:
+            # Fall through to the in-memory limiter if Redis is down
+            print(f"[WARN] Redis rate limit check failed: {e}")
+
+    bucket = int(current_time // _RATE_LIMIT_BUCKET_LEN)
+
+    # Periodically drop idle IPs so the cache doesn't grow unbounded
+    if current_time - _rate_limit_last_sweep >= window:
+        idle_ips = [
+            ip for ip, (stamps, _) in rate_limit_cache.items()
+            if bucket - max(stamps) >= _RATE_LIMIT_BUCKETS
+        ]
+        for ip in idle_ips:
+            del rate_limit_cache[ip]
+        _rate_limit_last_sweep = current_time
+
+    # New IP at the cap: evict the longest-standing entry (dict order is
+    # insertion order) so memory stays fixed regardless of client churn
+    if client_ip not in rate_limit_cache and len(rate_limit_cache) >= _RATE_LIMIT_MAX_IPS:
+        rate_limit_cache.pop(next(iter(rate_limit_cache)), None)
+
+    stamps, counts = rate_limit_cache[client_ip]
+
+    # Reclaim this slot if its last use was a previous lap of the ring
+    slot = bucket % _RATE_LIMIT_BUCKETS
+    if stamps[slot] != bucket:
+        stamps[slot] = bucket
+        counts[slot] = 0
+
+    # Sum only the buckets still inside the window
+    total = sum(
+        counts[i] for i in range(_RATE_LIMIT_BUCKETS)
+        if bucket - stamps[i] < _RATE_LIMIT_BUCKETS
+    )
+    if total >= config.RATE_LIMIT_MAX_REQUESTS:
         return False
-    
-    rate_limit_cache[client_ip].append(current_time)
+
+    counts[slot] += 1
     return True
 
 
@@ -116,16 +386,24 @@ def require_api_key(f):
 
 @app.before_request
 def before_request():
-    """Run before each request - rate limiting and logging."""
+    """Run before each request - rate limiting, body parsing and logging."""
+    # Parse the JSON body once per request; handlers read g.json instead of
+    # re-invoking request.json (which re-checks content type on every access).
+    # A malformed body parses to None - kept as-is so handlers that must
+    # distinguish "no valid JSON" from "empty object" (save_config) can
+    # reject it; the rest default with `g.get('json') or {}`.
+    if request.method in ('POST', 'PUT', 'PATCH') and request.is_json:
+        g.json = request.get_json(silent=True)
+
     # Skip rate limiting for auth endpoints during development
     if request.endpoint in ['login', 'register', 'health_check']:
         g.start_time = time.time()
         return
-    
+
     # Rate limiting
     if not rate_limit():
         return jsonify({"error": "Rate limit exceeded. Please wait."}), 429
-    
+
     g.start_time = time.time()
 
 
@@ -137,7 +415,7 @@ def before_request():
 def register():
     """Register a new user account."""
     try:
-        data = request.json or {}
+        data = g.get('json') or {}
         
         email = data.get('email', '').strip().lower()
         password = data.get('password', '')
@@ -261,7 +539,7 @@ If you didn't create an account, you can safely ignore this email.
 def login():
     """Authenticate user and return JWT token."""
     try:
-        data = request.json or {}
+        data = g.get('json') or {}
         
         email = data.get('email', '').strip().lower()
         password = data.get('password', '')
@@ -319,7 +597,7 @@ def get_current_user():
                     "target_goal": profile.target_goal if profile else None,
                     "sender_email": profile.sender_email if profile else user["email"],
                 },
-                "created_at": user["created_at"].isoformat() if user.get("created_at") else None,
+                "created_at": user.get("created_at"),
             })
         finally:
             db.close()
@@ -330,56 +608,71 @@ def get_current_user():
         return jsonify({"error": str(e)}), 500
 
 
+# JSON keys accepted by update_profile -> UserProfile columns
+_PROFILE_FIELD_MAP = {
+    'name': 'full_name',
+    'phone': 'phone',
+    'title': 'title',
+    'organization': 'organization',
+    'department': 'department',
+    'major': 'major',
+    'graduation_year': 'graduation_year',
+    'pitch': 'pitch',
+    'target_goal': 'target_goal',
+    'sender_email': 'sender_email',
+}
+
+
 @app.route('/api/auth/profile', methods=['PUT'])
 @require_auth
 def update_profile():
     """Update current user's profile."""
     try:
         user = g.current_user
-        data = request.json or {}
-        
+        data = g.get('json') or {}
+
+        # Single UPDATE instead of SELECT + per-field mutation + UPDATE;
+        # the INSERT fallback only runs for users without a profile row
+        values = {
+            column: data[key]
+            for key, column in _PROFILE_FIELD_MAP.items()
+            if key in data
+        }
+
         db = get_db_session()
         try:
-            from outreach_proj.models import UserProfile
-            
-            profile = db.query(UserProfile).filter(UserProfile.user_id == user["id"]).first()
-            
-            if not profile:
-                profile = UserProfile(user_id=user["id"], full_name=data.get('name', 'User'))
-                db.add(profile)
-            
-            # Update fields
-            if 'name' in data:
-                profile.full_name = data['name']
-            if 'phone' in data:
-                profile.phone = data['phone']
-            if 'title' in data:
-                profile.title = data['title']
-            if 'organization' in data:
-                profile.organization = data['organization']
-            if 'department' in data:
-                profile.department = data['department']
-            if 'major' in data:
-                profile.major = data['major']
-            if 'graduation_year' in data:
-                profile.graduation_year = data['graduation_year']
-            if 'pitch' in data:
-                profile.pitch = data['pitch']
-            if 'target_goal' in data:
-                profile.target_goal = data['target_goal']
-            if 'sender_email' in data:
-                profile.sender_email = data['sender_email']
-            
+            from sqlalchemy import insert, update
+
+            updated = 0
+            if values:
+                result = db.execute(
+                    update(UserProfile)
+                    .where(UserProfile.user_id == user["id"])
+                    .values(**values)
+                )
+                updated = result.rowcount
+
+            if updated == 0:
+                exists = db.query(UserProfile.id).filter(
+                    UserProfile.user_id == user["id"]
+                ).first()
+                if not exists:
+                    insert_values = dict(values)
+                    insert_values.setdefault('full_name', data.get('name', 'User'))
+                    db.execute(
+                        insert(UserProfile).values(user_id=user["id"], **insert_values)
+                    )
+
             db.commit()
-            
+
             return jsonify({
                 "success": True,
                 "message": "Profile updated successfully"
             })
-            
+
         finally:
             db.close()
-            
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -452,7 +745,7 @@ If you didn't request this reset, you can safely ignore this email.
 def forgot_password():
     """Request a password reset email."""
     try:
-        data = request.json or {}
+        data = g.get('json') or {}
         email = data.get('email', '').strip().lower()
         
         if not email or not validate_email(email):
@@ -496,7 +789,7 @@ def forgot_password():
 def reset_password_endpoint():
     """Reset password using a valid token."""
     try:
-        data = request.json or {}
+        data = g.get('json') or {}
         token = data.get('token', '').strip()
         new_password = data.get('password', '')
         
@@ -589,7 +882,7 @@ If you didn't create an account, you can safely ignore this email.
 def verify_email_endpoint():
     """Verify email using a valid token."""
     try:
-        data = request.json or {}
+        data = g.get('json') or {}
         token = data.get('token', '').strip()
         
         if not token:
@@ -676,62 +969,82 @@ def get_contacts_v2():
             limit = request.args.get('limit', 100, type=int)
             offset = request.args.get('offset', 0, type=int)
             
-            contacts = service.get_all(
+            # Plain column tuples - no ORM instance materialization per row
+            rows = service.get_all_rows(
                 skip=offset,
                 limit=limit,
                 status=status,
                 company=company,
                 search=search,
             )
-            
+
             return jsonify({
                 "contacts": [{
-                    "id": c.id,
-                    "firstName": c.first_name,
-                    "lastName": c.last_name or "",
-                    "email": c.email or "",
-                    "company": c.company or "",
-                    "jobTitle": c.job_title or "",
-                    "city": c.city or "",
-                    "state": c.state or "",
-                    "status": c.status or "pending",
-                } for c in contacts],
-                "total": len(contacts)
+                    "id": r[0],
+                    "firstName": r[1],
+                    "lastName": r[2] or "",
+                    "email": r[3] or "",
+                    "company": r[4] or "",
+                    "jobTitle": r[5] or "",
+                    "city": r[6] or "",
+                    "state": r[7] or "",
+                    "status": r[8] or "pending",
+                } for r in rows],
+                "total": len(rows)
             })
         
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+# Optional contact fields shared by the v2 create/update handlers, as
+# (json_key, column) pairs - one loop over a constant tuple instead of a
+# per-field if-ladder in each handler. Email is handled separately because
+# it is validated and normalized.
+_CONTACT_OPTIONAL_FIELDS = (
+    ('lastName', 'last_name'),
+    ('company', 'company'),
+    ('jobTitle', 'job_title'),
+    ('city', 'city'),
+    ('state', 'state'),
+    ('notes', 'notes'),
+)
+
+_CONTACT_UPDATE_FIELDS = (
+    ('firstName', 'first_name'),
+    ('phone', 'phone'),
+    ('linkedinUrl', 'linkedin_url'),
+    ('status', 'status'),
+) + _CONTACT_OPTIONAL_FIELDS
+
+
 @app.route('/api/v2/contacts', methods=['POST'])
 @require_auth
 def create_contact_v2():
     """Create a new contact for the authenticated user (database-backed)."""
     try:
-        data = request.json or {}
-        
+        data = g.get('json') or {}
+
         # Validate
         if not data.get('firstName'):
             return jsonify({"error": "First name is required"}), 400
-        
+
         email = data.get('email', '').strip()
         if email and not validate_email(email):
             return jsonify({"error": "Invalid email format"}), 400
-        
+
         with get_contact_service() as service:
             # Check for duplicate email
             if email and service.get_by_email(email):
                 return jsonify({"error": "Contact with this email already exists"}), 400
-            
+
             contact = service.create(
                 first_name=data.get('firstName', '').strip(),
-                last_name=data.get('lastName', '').strip() or None,
                 email=email or None,
-                company=data.get('company', '').strip() or None,
-                job_title=data.get('jobTitle', '').strip() or None,
-                city=data.get('city', '').strip() or None,
-                state=data.get('state', '').strip() or None,
-                notes=data.get('notes', '').strip() or None,
+                **{
+                    column: (data.get(key) or '').strip() or None
+                    for key, column in _CONTACT_OPTIONAL_FIELDS
+                },
             )
             
             return jsonify({
@@ -775,8 +1088,8 @@ def get_contact_v2(contact_id):
                 "linkedinUrl": contact.linkedin_url or "",
                 "notes": contact.notes or "",
                 "status": contact.status or "pending",
-                "lastContactedAt": contact.last_contacted_at.isoformat() if contact.last_contacted_at else None,
-                "createdAt": contact.created_at.isoformat() if contact.created_at else None,
+                "lastContactedAt": contact.last_contacted_at,
+                "createdAt": contact.created_at,
             })
         
     except Exception as e:
@@ -788,38 +1101,22 @@ def get_contact_v2(contact_id):
 def update_contact_v2(contact_id):
     """Update a contact."""
     try:
-        data = request.json or {}
+        data = g.get('json') or {}
         
         email = data.get('email', '').strip()
         if email and not validate_email(email):
             return jsonify({"error": "Invalid email format"}), 400
         
         with get_contact_service() as service:
-            # Build update kwargs (only include non-None values)
-            update_data = {}
-            if 'firstName' in data:
-                update_data['first_name'] = data['firstName']
-            if 'lastName' in data:
-                update_data['last_name'] = data['lastName']
+            # Build update kwargs from the shared field spec
+            update_data = {
+                column: data[key]
+                for key, column in _CONTACT_UPDATE_FIELDS
+                if key in data
+            }
             if email:
                 update_data['email'] = email
-            if 'company' in data:
-                update_data['company'] = data['company']
-            if 'jobTitle' in data:
-                update_data['job_title'] = data['jobTitle']
-            if 'city' in data:
-                update_data['city'] = data['city']
-            if 'state' in data:
-                update_data['state'] = data['state']
-            if 'phone' in data:
-                update_data['phone'] = data['phone']
-            if 'linkedinUrl' in data:
-                update_data['linkedin_url'] = data['linkedinUrl']
-            if 'notes' in data:
-                update_data['notes'] = data['notes']
-            if 'status' in data:
-                update_data['status'] = data['status']
-            
+
             contact = service.update(contact_id, **update_data)
             
             if not contact:
@@ -862,15 +1159,20 @@ def delete_contact_v2(contact_id):
 def import_contacts_v2():
     """Import contacts from CSV data."""
     try:
-        data = request.json or {}
-        csv_content = data.get('csv', '')
-        
-        if not csv_content:
-            return jsonify({"error": "No CSV content provided"}), 400
-        
+        # Prefer multipart uploads: the file streams straight into the CSV
+        # reader instead of being buffered twice (JSON body + csv string)
+        upload = request.files.get('csv') or request.files.get('file')
+        if upload is not None:
+            csv_source = TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+        else:
+            data = g.get('json') or {}
+            csv_source = data.get('csv', '')
+            if not csv_source:
+                return jsonify({"error": "No CSV content provided"}), 400
+
         with get_contact_service() as service:
-            imported, errors = service.import_from_csv(csv_content)
-            
+            imported, errors = service.import_from_csv(csv_source)
+
             return jsonify({
                 "success": True,
                 "imported": imported,
@@ -945,32 +1247,55 @@ def get_template(template_id):
 
 @app.route('/api/contacts', methods=['GET'])
 def get_contacts():
-    """Get all contacts (legacy - file-based)."""
+    """Get all contacts (legacy - file-based).
+
+    Deprecated: /api/v2/contacts serves the SQL-backed store, where email
+    dedup is an indexed probe instead of a CSV scan. These endpoints stay
+    only while the CLI still shares the CSV files.
+    """
     try:
-        contacts = load_contacts()
-        contacted = load_contacted_emails()
-        
-        result = []
-        for c in contacts:
-            email = c.get("Email Address", "").strip().lower()
-            status = "pending"
-            if not email:
-                status = "no-email"
-            elif email in contacted:
-                status = "sent"
-            
-            result.append({
-                "firstName": c.get("First Name", ""),
-                "lastName": c.get("Last Name", ""),
-                "email": c.get("Email Address", ""),
-                "company": c.get("Company", ""),
-                "jobTitle": c.get("Job Title", ""),
-                "city": c.get("Business City", ""),
-                "state": c.get("Business State", ""),
-                "status": status
-            })
-        
-        return jsonify({"contacts": result, "total": len(result)})
+        # Status depends on both the contacts file and the send log, so
+        # the validator covers both
+        etag = _stat_etag(DEFAULT_CONTACTS_FILE, DEFAULT_LOG_FILE)
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=304, headers={'ETag': etag})
+
+        contacts = _get_contacts_cached()
+        contacted = _get_contacted_cached()
+
+        # Stream the array row by row: the client starts receiving bytes
+        # immediately and peak memory stays one encoded row instead of
+        # the whole payload twice (list + serialized string)
+        def generate():
+            yield b'{"contacts":['
+            first = True
+            for c in contacts:
+                email = c["_email_norm"]
+                status = "pending"
+                if not email:
+                    status = "no-email"
+                elif email in contacted:
+                    status = "sent"
+
+                row = orjson.dumps({
+                    "firstName": c.get("First Name", ""),
+                    "lastName": c.get("Last Name", ""),
+                    "email": c.get("Email Address", ""),
+                    "company": c.get("Company", ""),
+                    "jobTitle": c.get("Job Title", ""),
+                    "city": c.get("Business City", ""),
+                    "state": c.get("Business State", ""),
+                    "status": status
+                })
+                yield row if first else b',' + row
+                first = False
+            yield b'],"total":%d}' % len(contacts)
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype='application/json',
+            headers={'ETag': etag},
+        )
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -978,9 +1303,9 @@ def get_contacts():
 @app.route('/api/contacts', methods=['POST'])
 @require_api_key
 def add_contact():
-    """Add a new contact."""
+    """Add a new contact (legacy - file-based, see get_contacts note)."""
     try:
-        data = request.json or {}
+        data = g.get('json') or {}
         
         # Validate required fields
         first_name = data.get('firstName', '').strip()
@@ -993,14 +1318,10 @@ def add_contact():
         if email and not validate_email(email):
             return jsonify({"error": "Invalid email format"}), 400
         
-        # Load existing contacts
-        contacts = load_contacts()
-        
-        # Check for duplicate email
-        if email:
-            for c in contacts:
-                if c.get("Email Address", "").strip().lower() == email.lower():
-                    return jsonify({"error": "A contact with this email already exists"}), 409
+        # Check for duplicate email - single hash probe on the index
+        _, email_index = _get_contacts_with_index()
+        if email and email.lower() in email_index:
+            return jsonify({"error": "A contact with this email already exists"}), 409
         
         # Add new contact
         new_contact = {
@@ -1013,10 +1334,8 @@ def add_contact():
             "Business State": data.get('state', ''),
         }
         
-        contacts.append(new_contact)
-        
-        # Save to CSV
-        save_contacts(contacts)
+        # One appended row instead of rewriting the whole CSV
+        append_contact(new_contact)
         
         return jsonify({
             "success": True,
@@ -1036,17 +1355,18 @@ def add_contact():
 @app.route('/api/contacts/<email>', methods=['DELETE'])
 @require_api_key
 def delete_contact(email):
-    """Delete a contact by email."""
+    """Delete a contact by email (legacy - file-based, see get_contacts note)."""
     try:
-        contacts = load_contacts()
-        
-        # Find and remove contact
-        original_len = len(contacts)
-        contacts = [c for c in contacts if c.get("Email Address", "").strip().lower() != email.lower()]
-        
-        if len(contacts) == original_len:
+        cached_contacts, email_index = _get_contacts_with_index()
+
+        # Find the contact with one index probe instead of a full scan
+        idx = email_index.get(email.lower())
+        if idx is None:
             return jsonify({"error": "Contact not found"}), 404
-        
+
+        contacts = list(cached_contacts)
+        contacts.pop(idx)
+
         # Save to CSV
         save_contacts(contacts)
         
@@ -1055,22 +1375,51 @@ def delete_contact(email):
         return jsonify({"error": str(e)}), 500
 
 
+# Stable column order shared by the full-rewrite and append paths
+_CONTACT_FIELDNAMES = ["First Name", "Last Name", "Email Address", "Company", "Job Title", "Business City", "Business State"]
+
+
+def append_contact(contact: dict) -> None:
+    """Append a single contact row to the CSV.
+
+    O(1) bytes written versus save_contacts' full rewrite; usable because
+    the column set is fixed. Deletes still go through save_contacts.
+    """
+    file_exists = os.path.exists(DEFAULT_CONTACTS_FILE)
+    with open(DEFAULT_CONTACTS_FILE, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=_CONTACT_FIELDNAMES, extrasaction='ignore')
+        if not file_exists:
+            writer.writeheader()
+        writer.writerow(contact)
+
+    _invalidate_file_cache(DEFAULT_CONTACTS_FILE)
+
+
 def save_contacts(contacts: list) -> None:
-    """Save contacts list to CSV file."""
-    fieldnames = ["First Name", "Last Name", "Email Address", "Company", "Job Title", "Business City", "Business State"]
-    
-    with open(DEFAULT_CONTACTS_FILE, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(contacts)
+    """Save contacts list to CSV file atomically."""
+    # Serialize into memory first: one buffer flush instead of many small
+    # writes, and nothing touches disk if serialization raises
+    buf = StringIO()
+    writer = csv.DictWriter(buf, fieldnames=_CONTACT_FIELDNAMES, extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(contacts)
+
+    # Write to a sibling temp file and rename into place; os.replace is
+    # atomic, so concurrent readers never see a half-written CSV
+    tmp_path = DEFAULT_CONTACTS_FILE + '.tmp'
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        f.write(buf.getvalue())
+    os.replace(tmp_path, DEFAULT_CONTACTS_FILE)
+
+    _invalidate_file_cache(DEFAULT_CONTACTS_FILE)
 
 
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get configuration."""
     try:
-        config = load_config()
-        return jsonify(config)
+        etag = _stat_etag(DEFAULT_CONFIG_FILE)
+        return _etag_response('config', etag, _get_config)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -1080,9 +1429,19 @@ def get_config():
 def save_config():
     """Save configuration."""
     try:
-        config = request.json
-        with open(DEFAULT_CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
+        config = g.get('json')
+        # A missing/wrong content type (g.json never set) or a malformed
+        # body (parsed to None) both land here as None - reject instead
+        # of writing null over the config file
+        if config is None:
+            return jsonify({"error": "Request body must be JSON"}), 400
+        # Serialize first, then swap in atomically so a crash mid-write
+        # can't leave a corrupt config behind. Indented for hand edits.
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        tmp_path = DEFAULT_CONFIG_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, DEFAULT_CONFIG_FILE)
         return jsonify({"success": True})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -1090,55 +1449,189 @@ def save_config():
 
 @app.route('/api/logs', methods=['GET'])
 def get_logs():
-    """Get email logs."""
+    """Get email logs (most recent first, capped by ?limit=)."""
     try:
-        logs = []
-        if os.path.exists(DEFAULT_LOG_FILE):
-            with open(DEFAULT_LOG_FILE, newline='', encoding='utf-8') as f:
-                content = f.read()
-                if content.startswith("\ufeff"):
-                    content = content[1:]
-                reader = csv.DictReader(StringIO(content))
-                for row in reader:
-                    logs.append({
-                        "timestamp": row.get("Timestamp", ""),
-                        "email": row.get("Email", ""),
-                        "company": row.get("Company", ""),
-                        "status": row.get("Status", ""),
-                        "subject": row.get("Subject", ""),
-                        "error": row.get("Error", "")
-                    })
-        
-        # Return in reverse chronological order
-        logs.reverse()
-        return jsonify({"logs": logs, "total": len(logs)})
+        try:
+            limit = int(request.args.get('limit', 500))
+        except (TypeError, ValueError):
+            limit = 500
+
+        # Rows come from the mtime-keyed parse cache, so repeated polls
+        # only pay for a slice; the tail keeps the response bounded by
+        # the requested page. Newest first.
+        rows = _cached_load(DEFAULT_LOG_FILE, _load_log_rows)
+        logs = rows[-limit:][::-1] if limit > 0 else []
+        # total is the full log count, not the page length - the UI shows
+        # it next to the (possibly truncated) page
+        return jsonify({"logs": logs, "total": len(rows)})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+# Shared pool for the per-contact work in /api/dry-run and /api/send.
+# Generation (LLM call) and Gmail sends are network-bound and independent
+# per contact, so batches overlap instead of running back to back.
+_contact_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='outreach')
+
+# One Gmail service per thread: building it runs credential refresh plus
+# API discovery (a network round-trip or two), which only needs to happen
+# once per thread rather than once per request. thread-local because
+# httplib2 transports are not safe to share across threads.
+_gmail_local = threading.local()
+
+
+def _gmail_service(refresh=False):
+    """Return this thread's cached Gmail service, building it on first use."""
+    service = None if refresh else getattr(_gmail_local, 'service', None)
+    if service is None:
+        service = _gmail_local.service = get_gmail_service()
+    return service
+
+
+class _LogWriter:
+    """Buffered, thread-safe appender for the send log.
+
+    append_log opens and closes the CSV for every row, which is two
+    syscall pairs per contact during a batched send. This keeps one
+    long-lived append handle, buffers rows in memory, and writes the
+    batch out with a single writerows + flush per request.
+    """
+
+    FIELDNAMES = ["Timestamp", "Email", "Company", "Status", "Subject", "Error"]
+
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._writer = None
+        self._pending = []
+
+    def _ensure_open(self):
+        if self._file is None:
+            file_exists = os.path.exists(self._path)
+            self._file = open(self._path, 'a', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._file, fieldnames=self.FIELDNAMES)
+            if not file_exists:
+                self._writer.writeheader()
+
+    def append(self, contact, status, subject, error_msg=""):
+        row = {
+            "Timestamp": datetime.now().isoformat(),
+            "Email": contact.get("Email Address", ""),
+            "Company": contact.get("Company", ""),
+            "Status": status,
+            "Subject": subject,
+            "Error": error_msg,
+        }
+        with self._lock:
+            self._pending.append(row)
+
+    def flush(self):
+        """Write buffered rows to disk and drop the stale contacted cache."""
+        with self._lock:
+            if not self._pending:
+                return
+            self._ensure_open()
+            self._writer.writerows(self._pending)
+            self._file.flush()
+            self._pending.clear()
+        _invalidate_file_cache(self._path)
+
+
+log_writer = _LogWriter(DEFAULT_LOG_FILE)
+
+
+def _draft_one(contact, config):
+    """Generate and save one draft; returns the result row for the response."""
+    recipient = f"{contact.get('First Name', '')} {contact.get('Last Name', '')}".strip()
+    try:
+        subject, body = generate_personalized_email(contact, config)
+        filename = save_draft(contact, subject, body)
+        log_writer.append(contact, "DRY_RUN", subject)
+        return {
+            "recipient": recipient,
+            "email": contact.get("Email Address", ""),
+            "company": contact.get("Company", ""),
+            "subject": subject,
+            "body": body,
+            "preview": body[:150] + "..." if len(body) > 150 else body,
+            "filename": filename,
+            "date": datetime.now().isoformat()
+        }
+    except Exception as e:
+        log_writer.append(contact, "ERROR", "N/A", str(e))
+        return {
+            "recipient": recipient,
+            "email": contact.get("Email Address", ""),
+            "error": str(e)
+        }
+
+
+def _send_one(contact, config):
+    """Generate and send one email; returns the result row for the response."""
+    recipient = f"{contact.get('First Name', '')} {contact.get('Last Name', '')}".strip()
+    email = contact.get("Email Address", "").strip()
+    try:
+        subject, body = generate_personalized_email(contact, config)
+
+        msg = create_message(
+            sender_name=config["your_name"],
+            sender_email=config["your_email"],
+            to=email,
+            subject=subject,
+            body_text=body,
+        )
+        try:
+            send_message(_gmail_service(), "me", msg)
+        except HttpError as e:
+            if e.resp.status not in (401, 403):
+                raise
+            # Credentials likely went stale under us - rebuild the
+            # service once and retry before reporting a failure
+            send_message(_gmail_service(refresh=True), "me", msg)
+        log_writer.append(contact, "SENT", subject)
+
+        return {
+            "recipient": recipient,
+            "email": email,
+            "company": contact.get("Company", ""),
+            "subject": subject,
+            "status": "sent"
+        }
+    except Exception as e:
+        log_writer.append(contact, "ERROR", "N/A", str(e))
+        return {
+            "recipient": recipient,
+            "email": email,
+            "error": str(e),
+            "status": "error"
+        }
+
+
 @app.route('/api/dry-run', methods=['POST'])
 @require_api_key
 def dry_run():
     """Generate email drafts without sending."""
     try:
-        data = request.json or {}
+        data = g.get('json') or {}
         limit = data.get('limit', 5)
         email_filter = data.get('email')  # Optional: specific email to generate for
         
-        config = load_config()
-        contacts = load_contacts()
-        contacted = load_contacted_emails()
-        
-        # Filter contacts
-        contacts = [c for c in contacts if c.get("Email Address", "").strip()]
+        config = _get_config()
         
         if email_filter:
-            contacts = [c for c in contacts if c.get("Email Address", "").strip().lower() == email_filter.lower()]
+            # Single-contact case (the frontend's "send one" button):
+            # jump straight to the row via the email index, no scan
+            cached_contacts, email_index = _get_contacts_with_index()
+            idx = email_index.get(email_filter.lower())
+            contacts = [cached_contacts[idx]] if idx is not None else []
         else:
-            # Filter out already contacted
-            contacts = [c for c in contacts if c.get("Email Address", "").strip().lower() not in contacted]
-        
-        contacts = contacts[:limit]
+            contacts = _get_contacts_cached()
+            contacted = _get_contacted_cached()
+            # Single fused filter pass, stopping once the limit is filled
+            contacts = list(islice(
+                _eligible_contacts(contacts, contacted), limit
+            ))
         
         if not contacts:
             return jsonify({
@@ -1147,30 +1640,14 @@ def dry_run():
                 "message": "No new contacts to process"
             })
         
-        drafts = []
-        for contact in contacts:
-            try:
-                subject, body = generate_personalized_email(contact, config)
-                filename = save_draft(contact, subject, body)
-                append_log(contact, "DRY_RUN", subject)
-                
-                drafts.append({
-                    "recipient": f"{contact.get('First Name', '')} {contact.get('Last Name', '')}".strip(),
-                    "email": contact.get("Email Address", ""),
-                    "company": contact.get("Company", ""),
-                    "subject": subject,
-                    "body": body,
-                    "preview": body[:150] + "..." if len(body) > 150 else body,
-                    "filename": filename,
-                    "date": datetime.now().isoformat()
-                })
-            except Exception as e:
-                append_log(contact, "ERROR", "N/A", str(e))
-                drafts.append({
-                    "recipient": f"{contact.get('First Name', '')} {contact.get('Last Name', '')}".strip(),
-                    "email": contact.get("Email Address", ""),
-                    "error": str(e)
-                })
+        # Fan the batch out across the pool; map preserves contact order.
+        # Flush in finally so rows logged before any failure still land.
+        try:
+            drafts = list(_contact_pool.map(
+                lambda contact: _draft_one(contact, config), contacts
+            ))
+        finally:
+            log_writer.flush()
         
         return jsonify({
             "success": True,
@@ -1186,7 +1663,7 @@ def dry_run():
 def send_email_endpoint():
     """Send emails to contacts."""
     try:
-        data = request.json or {}
+        data = g.get('json') or {}
         limit = min(data.get('limit', 1), 50)  # Cap at 50 emails per request
         email_filter = data.get('email')  # Optional: specific email to send to
         
@@ -1194,26 +1671,22 @@ def send_email_endpoint():
         if email_filter and not validate_email(email_filter):
             return jsonify({"error": "Invalid email format"}), 400
         
-        config = load_config()
-        contacts = load_contacts()
-        contacted = load_contacted_emails()
-        
-        # Get Gmail service
-        service = get_gmail_service()
-        
-        # Filter contacts with valid emails
-        contacts = [
-            c for c in contacts 
-            if c.get("Email Address", "").strip() and validate_email(c.get("Email Address", "").strip())
-        ]
+        config = _get_config()
         
         if email_filter:
-            contacts = [c for c in contacts if c.get("Email Address", "").strip().lower() == email_filter.lower()]
+            # Single-contact case: one index probe instead of a full
+            # filter pass (the filter itself was already validated above)
+            cached_contacts, email_index = _get_contacts_with_index()
+            idx = email_index.get(email_filter.lower())
+            contacts = [cached_contacts[idx]] if idx is not None else []
         else:
-            # Filter out already contacted
-            contacts = [c for c in contacts if c.get("Email Address", "").strip().lower() not in contacted]
-        
-        contacts = contacts[:limit]
+            contacts = _get_contacts_cached()
+            contacted = _get_contacted_cached()
+            # Single fused filter pass (with validation), stopping at the limit
+            contacts = list(islice(
+                _eligible_contacts(contacts, contacted, require_valid=True),
+                limit,
+            ))
         
         if not contacts:
             return jsonify({
@@ -1222,37 +1695,15 @@ def send_email_endpoint():
                 "message": "No new contacts to send to"
             })
         
-        sent = []
-        for contact in contacts:
-            email = contact.get("Email Address", "").strip()
-            try:
-                subject, body = generate_personalized_email(contact, config)
-                
-                msg = create_message(
-                    sender_name=config["your_name"],
-                    sender_email=config["your_email"],
-                    to=email,
-                    subject=subject,
-                    body_text=body,
-                )
-                send_message(service, "me", msg)
-                append_log(contact, "SENT", subject)
-                
-                sent.append({
-                    "recipient": f"{contact.get('First Name', '')} {contact.get('Last Name', '')}".strip(),
-                    "email": email,
-                    "company": contact.get("Company", ""),
-                    "subject": subject,
-                    "status": "sent"
-                })
-            except Exception as e:
-                append_log(contact, "ERROR", "N/A", str(e))
-                sent.append({
-                    "recipient": f"{contact.get('First Name', '')} {contact.get('Last Name', '')}".strip(),
-                    "email": email,
-                    "error": str(e),
-                    "status": "error"
-                })
+        # Fan the batch out across the pool; map preserves contact order.
+        # Each pool thread builds (then reuses) its own Gmail service.
+        # Flush in finally so rows logged before any failure still land.
+        try:
+            sent = list(_contact_pool.map(
+                lambda contact: _send_one(contact, config), contacts
+            ))
+        finally:
+            log_writer.flush()
         
         return jsonify({
             "success": True,
@@ -1263,48 +1714,90 @@ def send_email_endpoint():
         return jsonify({"error": str(e)}), 500
 
 
+# Draft-file header markers, hoisted so the parse loop in get_drafts
+# doesn't rebuild the separator string for every line it tests
+_DRAFT_SEP = '-' * 10
+_DRAFT_HDR_TO = 'TO: '
+_DRAFT_HDR_SUBJECT = 'SUBJECT: '
+
+# Parsed listing rows keyed by filename with (mtime_ns, size) stamps:
+# in steady state a /api/drafts request is one directory walk plus dict
+# probes, with files re-opened only when they actually change.
+_drafts_cache = {}
+
+
 @app.route('/api/drafts', methods=['GET'])
 def get_drafts():
-    """Get saved drafts from the drafts directory."""
+    """Get saved drafts from the drafts directory.
+
+    The listing returns headers and a short preview per draft; pass
+    ?full=1 to include complete bodies.
+    """
     try:
+        full = request.args.get('full') in ('1', 'true', 'yes')
         drafts = []
+        seen = set()
         if os.path.exists(DEFAULT_DRAFTS_DIR):
-            for filename in os.listdir(DEFAULT_DRAFTS_DIR):
-                if filename.endswith('.txt'):
-                    filepath = os.path.join(DEFAULT_DRAFTS_DIR, filename)
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    lines = content.split('\n')
+            # scandir yields cached stat results with each entry, so the
+            # listing doesn't cost an extra stat() syscall per draft
+            with os.scandir(DEFAULT_DRAFTS_DIR) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.txt') or not entry.is_file():
+                        continue
+
+                    st = entry.stat()
+                    stamp = (st.st_mtime_ns, st.st_size)
+                    seen.add(entry.name)
+
+                    # Full-body requests bypass the cache (it only holds
+                    # the preview-sized parse)
+                    if not full:
+                        cached = _drafts_cache.get(entry.name)
+                        if cached is not None and cached[0] == stamp:
+                            drafts.append(cached[1])
+                            continue
+
                     to_email = ""
                     subject = ""
                     body = ""
-                    
-                    for i, line in enumerate(lines):
-                        if line.startswith("TO: "):
-                            to_email = line[4:].strip()
-                        elif line.startswith("SUBJECT: "):
-                            subject = line[9:].strip()
-                        elif line.startswith("-" * 10):
-                            body = '\n'.join(lines[i+2:]).strip()
-                            break
-                    
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            if line.startswith(_DRAFT_HDR_TO):
+                                to_email = line[4:].strip()
+                            elif line.startswith(_DRAFT_HDR_SUBJECT):
+                                subject = line[9:].strip()
+                            elif line.startswith(_DRAFT_SEP):
+                                # Skip the blank line after the separator,
+                                # then read just enough for the preview
+                                # unless the full body was requested
+                                f.readline()
+                                body = f.read() if full else f.read(200)
+                                break
+                    body = body.strip()
+
                     # Parse name from filename
-                    name_parts = filename.replace('.txt', '').split('_')
+                    name_parts = entry.name.replace('.txt', '').split('_')
                     first_name = name_parts[0] if len(name_parts) > 0 else ""
                     last_name = name_parts[1] if len(name_parts) > 1 else ""
                     company = name_parts[2] if len(name_parts) > 2 else ""
-                    
-                    drafts.append({
-                        "filename": filename,
+
+                    draft = {
+                        "filename": entry.name,
                         "recipient": f"{first_name} {last_name}".strip(),
                         "email": to_email,
                         "company": company.replace('_', ' '),
                         "subject": subject,
-                        "body": body,
+                        "body": body if full else "",
                         "preview": body[:150] + "..." if len(body) > 150 else body,
-                        "date": datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat()
-                    })
+                        "date": datetime.fromtimestamp(st.st_mtime).isoformat()
+                    }
+                    if not full:
+                        _drafts_cache[entry.name] = (stamp, draft)
+                    drafts.append(draft)
+
+        # Forget drafts whose files were deleted
+        for name in _drafts_cache.keys() - seen:
+            del _drafts_cache[name]
         
         # Sort by date descending
         drafts.sort(key=lambda x: x['date'], reverse=True)
@@ -1368,7 +1861,7 @@ def apollo_search():
                 "message": "Set APOLLO_API_KEY environment variable to enable contact discovery"
             }), 400
         
-        data = request.json or {}
+        data = g.get('json') or {}
         
         # Extract search parameters
         company = data.get('company')
@@ -1431,7 +1924,7 @@ def apollo_enrich():
                 "error": "Apollo API key not configured"
             }), 400
         
-        data = request.json or {}
+        data = g.get('json') or {}
         
         contact = apollo.enrich_person(
             email=data.get('email'),
@@ -1479,7 +1972,7 @@ def apollo_find_email():
                 "error": "Apollo API key not configured"
             }), 400
         
-        data = request.json or {}
+        data = g.get('json') or {}
         
         first_name = data.get('firstName')
         last_name = data.get('lastName')
@@ -1532,7 +2025,7 @@ def apollo_import_contacts():
                 "error": "Apollo API key not configured"
             }), 400
         
-        data = request.json or {}
+        data = g.get('json') or {}
         
         # Perform search
         contacts, total = apollo.search_people(
@@ -1621,7 +2114,7 @@ def apollo_search_companies():
                 "error": "Apollo API key not configured"
             }), 400
         
-        data = request.json or {}
+        data = g.get('json') or {}
         
         companies = apollo.search_organizations(
             name=data.get('name'),
@@ -1700,7 +2193,7 @@ def hunter_search():
                 "message": "Set HUNTER_API_KEY environment variable to enable contact discovery"
             }), 400
         
-        data = request.json or {}
+        data = g.get('json') or {}
         
         domain = data.get('domain')
         if not domain:
@@ -1761,7 +2254,7 @@ def hunter_find_email():
                 "error": "Hunter API key not configured"
             }), 400
         
-        data = request.json or {}
+        data = g.get('json') or {}
         
         first_name = data.get('firstName')
         last_name = data.get('lastName')
@@ -1812,7 +2305,7 @@ def hunter_verify_email():
         if not hunter.is_configured:
             return jsonify({"error": "Hunter API key not configured"}), 400
         
-        data = request.json or {}
+        data = g.get('json') or {}
         email = data.get('email')
         
         if not email:
@@ -1851,7 +2344,7 @@ def hunter_import_contacts():
         if not hunter.is_configured:
             return jsonify({"error": "Hunter API key not configured"}), 400
         
-        data = request.json or {}
+        data = g.get('json') or {}
         user = g.current_user
         
         domain = data.get('domain')
@@ -1983,4 +2476,24 @@ if __name__ == '__main__':
     if debug_mode:
         print("⚠️  WARNING: Running in debug mode. Do not use in production!\n")
     
-    app.run(host=args.host, port=args.port, debug=debug_mode)
+    if debug_mode:
+        # Werkzeug dev server: reloader + debugger, threaded so one slow
+        # request doesn't serialize the whole API even in development
+        app.run(host=args.host, port=args.port, debug=True, threaded=True)
+    else:
+        # Production: waitress is a proper WSGI server with a thread pool.
+        # Most endpoints are dominated by DB round-trips and Gmail/OpenAI
+        # network calls, so overlapping requests across threads is the main
+        # concurrency win available to this (sync SQLAlchemy) stack.
+        try:
+            from waitress import serve
+        except ImportError:
+            print("⚠️  waitress not installed, falling back to the dev server")
+            app.run(host=args.host, port=args.port, threaded=True)
+        else:
+            serve(
+                app,
+                host=args.host,
+                port=args.port,
+                threads=int(os.environ.get("WEB_THREADS", "8")),
+            )
@@ -10,9 +10,15 @@ import os
 import sys
 import time
 import re
+from collections import defaultdict
 from datetime import datetime
 from functools import wraps
-from flask import Flask, jsonify, request, g
+from io import TextIOWrapper
+
+import base64
+
+import orjson
+from flask import Flask, Response, jsonify, request, g, stream_with_context
 from flask_cors import CORS
 
 # Add the project to path
@@ -27,49 +33,99 @@ from outreach_proj.auth import (
     create_access_token, create_user, authenticate_user
 )
 from outreach_proj.services import ContactService, TemplateService, EmailService
+# require_auth stores a token-payload dict on g.current_user; the service
+# layer needs the mapped User (it reads user.id and user.profile), so the
+# handlers resolve it through _request_user, one profile-joined SELECT per
+# request shared across services.
+from outreach_proj.api_helpers import OrjsonProvider, _request_user
 
 # ========================================
 # App Configuration
 # ========================================
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = config.SECRET_KEY
 
 # CORS Configuration
 CORS(app, origins=config.ALLOWED_ORIGINS, supports_credentials=True)
 
-# Rate limiting (simple in-memory)
-rate_limit_cache = {}
+# Rate limiting (simple in-memory) - sliding-window bucket counters: the
+# window is split into fixed sub-buckets and each IP stores six
+# (stamp, count) slots, so memory per IP is constant
+_RATE_LIMIT_BUCKETS = 6
+_RATE_LIMIT_BUCKET_LEN = max(1, config.RATE_LIMIT_WINDOW // _RATE_LIMIT_BUCKETS)
+rate_limit_cache = defaultdict(
+    lambda: ([0] * _RATE_LIMIT_BUCKETS, [0] * _RATE_LIMIT_BUCKETS)
+)
+# Hard cap on tracked IPs: scanners and spoofed addresses can otherwise
+# grow the cache without bound between sweeps
+_RATE_LIMIT_MAX_IPS = 50000
+_rate_limit_last_sweep = time.monotonic()
 
 
 # ========================================
 # Utilities
 # ========================================
 
+# Compiled once at import so each call is a single match against the
+# cached pattern object instead of a re-module cache lookup.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
 def validate_email(email: str) -> bool:
     """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # Cheap structural pre-check: most invalid inputs lack an '@' or a
+    # dotted domain, and these byte scans reject them without entering
+    # the regex engine at all
+    local, sep, domain = email.rpartition('@')
+    if not sep or not local or '.' not in domain:
+        return False
+    return _EMAIL_RE.match(email) is not None
 
 
 def rate_limit():
     """Simple in-memory rate limiter."""
+    global _rate_limit_last_sweep
     client_ip = request.remote_addr
-    current_time = time.time()
-    
-    if client_ip not in rate_limit_cache:
-        rate_limit_cache[client_ip] = []
-    
-    # Clean old requests
-    rate_limit_cache[client_ip] = [
-        t for t in rate_limit_cache[client_ip] 
-        if current_time - t < config.RATE_LIMIT_WINDOW
-    ]
-    
-    if len(rate_limit_cache[client_ip]) >= config.RATE_LIMIT_MAX_REQUESTS:
+    # Monotonic clock: immune to wall-clock jumps (NTP, DST)
+    current_time = time.monotonic()
+    window = config.RATE_LIMIT_WINDOW
+
+    bucket = int(current_time // _RATE_LIMIT_BUCKET_LEN)
+
+    # Periodically drop idle IPs so the cache doesn't grow unbounded
+    if current_time - _rate_limit_last_sweep >= window:
+        idle_ips = [
+            ip for ip, (stamps, _) in rate_limit_cache.items()
+            if bucket - max(stamps) >= _RATE_LIMIT_BUCKETS
+        ]
+        for ip in idle_ips:
+            del rate_limit_cache[ip]
+        _rate_limit_last_sweep = current_time
+
+    # New IP at the cap: evict the longest-standing entry (dict order is
+    # insertion order) so memory stays fixed regardless of client churn
+    if client_ip not in rate_limit_cache and len(rate_limit_cache) >= _RATE_LIMIT_MAX_IPS:
+        rate_limit_cache.pop(next(iter(rate_limit_cache)), None)
+
+    stamps, counts = rate_limit_cache[client_ip]
+
+    # Reclaim this slot if its last use was a previous lap of the ring
+    slot = bucket % _RATE_LIMIT_BUCKETS
+    if stamps[slot] != bucket:
+        stamps[slot] = bucket
+        counts[slot] = 0
+
+    # Sum only the buckets still inside the window
+    total = sum(
+        counts[i] for i in range(_RATE_LIMIT_BUCKETS)
+        if bucket - stamps[i] < _RATE_LIMIT_BUCKETS
+    )
+    if total >= config.RATE_LIMIT_MAX_REQUESTS:
         return False
-    
-    rate_limit_cache[client_ip].append(current_time)
+
+    counts[slot] += 1
     return True
 
 
@@ -200,7 +256,7 @@ def login():
 @require_auth
 def get_current_user():
     """Get current authenticated user."""
-    user = g.current_user
+    user = _request_user(g.db)
     profile = user.profile
     
     return jsonify({
@@ -208,7 +264,7 @@ def get_current_user():
         "email": user.email,
         "fullName": profile.full_name if profile else user.email,
         "isVerified": user.is_verified,
-        "createdAt": user.created_at.isoformat() if user.created_at else None,
+        "createdAt": user.created_at,
         "profile": {
             "phone": profile.phone if profile else None,
             "title": profile.title if profile else None,
@@ -223,12 +279,64 @@ def get_current_user():
     })
 
 
+# Response keys for get_contacts, positionally matching the columns of
+# ContactService.get_page rows
+_CONTACT_PAGE_KEYS = (
+    "id", "firstName", "lastName", "email", "company", "jobTitle",
+    "city", "state", "status", "phone", "notes", "createdAt",
+)
+
+# JSON keys accepted by update_contact -> Contact columns
+_CONTACT_FIELD_MAP = {
+    'firstName': 'first_name',
+    'lastName': 'last_name',
+    'email': 'email',
+    'company': 'company',
+    'jobTitle': 'job_title',
+    'city': 'city',
+    'state': 'state',
+    'phone': 'phone',
+    'notes': 'notes',
+    'status': 'status',
+}
+
+# JSON keys accepted by update_template -> EmailTemplate columns
+_TEMPLATE_FIELD_MAP = {
+    'name': 'name',
+    'description': 'description',
+    'category': 'category',
+    'subjectTemplate': 'subject_template',
+    'bodyTemplate': 'body_template',
+    'systemPrompt': 'system_prompt',
+    'userPromptTemplate': 'user_prompt_template',
+    'isDefault': 'is_default',
+    'isActive': 'is_active',
+}
+
+# JSON keys accepted by update_profile -> UserProfile columns
+_PROFILE_FIELD_MAP = {
+    'fullName': 'full_name',
+    'phone': 'phone',
+    'title': 'title',
+    'organization': 'organization',
+    'department': 'department',
+    'major': 'major',
+    'graduationYear': 'graduation_year',
+    'pitch': 'pitch',
+    'targetGoal': 'target_goal',
+    'senderEmail': 'sender_email',
+    'skills': 'skills',
+    'experience': 'experience',
+    'signatureTemplate': 'signature_template',
+}
+
+
 @app.route('/api/auth/profile', methods=['PUT'])
 @require_auth
 def update_profile():
     """Update user profile."""
     data = request.json or {}
-    user = g.current_user
+    user = _request_user(g.db)
     
     profile = user.profile
     if not profile:
@@ -236,33 +344,11 @@ def update_profile():
         profile = UserProfile(user_id=user.id, full_name=user.email)
         g.db.add(profile)
     
-    # Update fields
-    if 'fullName' in data:
-        profile.full_name = data['fullName']
-    if 'phone' in data:
-        profile.phone = data['phone']
-    if 'title' in data:
-        profile.title = data['title']
-    if 'organization' in data:
-        profile.organization = data['organization']
-    if 'department' in data:
-        profile.department = data['department']
-    if 'major' in data:
-        profile.major = data['major']
-    if 'graduationYear' in data:
-        profile.graduation_year = data['graduationYear']
-    if 'pitch' in data:
-        profile.pitch = data['pitch']
-    if 'targetGoal' in data:
-        profile.target_goal = data['targetGoal']
-    if 'senderEmail' in data:
-        profile.sender_email = data['senderEmail']
-    if 'skills' in data:
-        profile.skills = data['skills']
-    if 'experience' in data:
-        profile.experience = data['experience']
-    if 'signatureTemplate' in data:
-        profile.signature_template = data['signatureTemplate']
+    # Update fields; skip values that didn't change so untouched columns
+    # fire no ORM instrumentation and a no-op PUT marks nothing dirty
+    for key, attr in _PROFILE_FIELD_MAP.items():
+        if key in data and getattr(profile, attr) != data[key]:
+            setattr(profile, attr, data[key])
     
     return jsonify({"success": True})
 
@@ -275,7 +361,7 @@ def update_profile():
 @require_auth
 def get_contacts():
     """Get all contacts for the current user."""
-    user = g.current_user
+    user = _request_user(g.db)
     
     # Query params
     skip = request.args.get('skip', 0, type=int)
@@ -283,40 +369,43 @@ def get_contacts():
     status = request.args.get('status')
     company = request.args.get('company')
     search = request.args.get('search')
-    
+
+    # Opaque keyset cursor from a previous page; wins over skip because
+    # OFFSET costs the database every skipped row while a seek does not
+    after = request.args.get('after')
+    cursor = None
+    if after:
+        try:
+            created_s, last_id = orjson.loads(base64.urlsafe_b64decode(after))
+            cursor = (datetime.fromisoformat(created_s), last_id)
+        except (ValueError, TypeError, orjson.JSONDecodeError):
+            return jsonify({"error": "Invalid cursor"}), 400
+    
+    # One SELECT: page rows + was_contacted flag + windowed total. No
+    # separate COUNT query and no full contacted-set load per request.
     service = ContactService(g.db, user)
-    contacts = service.get_all(skip=skip, limit=limit, status=status, company=company, search=search)
-    total = service.get_count()
-    
-    # Get contacted emails for status
-    email_service = EmailService(g.db, user)
-    contacted = email_service.get_contacted_emails()
+    rows, total = service.get_page(skip=skip, limit=limit, status=status, company=company, search=search, after=cursor)
     
+    # dict(zip(...)) builds each row dict in one C call instead of twelve
+    # keyed stores; zip also drops the trailing was_contacted/total columns
+    # since the key tuple is shorter than the row
     result = []
-    for c in contacts:
-        email = (c.email or "").lower()
-        contact_status = c.status
-        if not email:
-            contact_status = "no-email"
-        elif email in contacted:
-            contact_status = "sent"
-        
-        result.append({
-            "id": c.id,
-            "firstName": c.first_name,
-            "lastName": c.last_name,
-            "email": c.email,
-            "company": c.company,
-            "jobTitle": c.job_title,
-            "city": c.city,
-            "state": c.state,
-            "phone": c.phone,
-            "status": contact_status,
-            "notes": c.notes,
-            "createdAt": c.created_at.isoformat() if c.created_at else None,
-        })
-    
-    return jsonify({"contacts": result, "total": total})
+    for r in rows:
+        d = dict(zip(_CONTACT_PAGE_KEYS, r))
+        if not d["email"]:
+            d["status"] = "no-email"
+        elif r.was_contacted:
+            d["status"] = "sent"
+        result.append(d)
+
+    next_cursor = None
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        next_cursor = base64.urlsafe_b64encode(
+            orjson.dumps([last.created_at, last.id])
+        ).decode('ascii')
+    
+    return jsonify({"contacts": result, "total": total, "nextCursor": next_cursor})
 
 
 @app.route('/api/contacts', methods=['POST'])
@@ -324,7 +413,7 @@ def get_contacts():
 def add_contact():
     """Add a new contact."""
     data = request.json or {}
-    user = g.current_user
+    user = _request_user(g.db)
     
     first_name = data.get('firstName', '').strip()
     if not first_name:
@@ -371,29 +460,17 @@ def add_contact():
 def update_contact(contact_id):
     """Update a contact."""
     data = request.json or {}
-    user = g.current_user
+    user = _request_user(g.db)
     
     service = ContactService(g.db, user)
     
-    # Map camelCase to snake_case
-    update_data = {}
-    field_map = {
-        'firstName': 'first_name',
-        'lastName': 'last_name',
-        'email': 'email',
-        'company': 'company',
-        'jobTitle': 'job_title',
-        'city': 'city',
-        'state': 'state',
-        'phone': 'phone',
-        'notes': 'notes',
-        'status': 'status',
+    # Map camelCase to snake_case; dict key-view intersection is a C-level
+    # hash join, so only keys actually present in the payload are touched
+    update_data = {
+        _CONTACT_FIELD_MAP[k]: data[k]
+        for k in data.keys() & _CONTACT_FIELD_MAP.keys()
     }
     
-    for camel, snake in field_map.items():
-        if camel in data:
-            update_data[snake] = data[camel]
-    
     contact = service.update(contact_id, **update_data)
     if not contact:
         return jsonify({"error": "Contact not found"}), 404
@@ -405,7 +482,7 @@ def update_contact(contact_id):
 @require_auth
 def delete_contact_by_id(contact_id):
     """Delete a contact by ID."""
-    user = g.current_user
+    user = _request_user(g.db)
     service = ContactService(g.db, user)
     
     if not service.delete(contact_id):
@@ -418,7 +495,7 @@ def delete_contact_by_id(contact_id):
 @require_auth
 def delete_contact_by_email(email):
     """Delete a contact by email (legacy endpoint)."""
-    user = g.current_user
+    user = _request_user(g.db)
     service = ContactService(g.db, user)
     
     contact = service.get_by_email(email)
@@ -433,21 +510,22 @@ def delete_contact_by_email(email):
 @require_auth
 def import_contacts():
     """Import contacts from CSV."""
-    user = g.current_user
+    user = _request_user(g.db)
     
     if 'file' not in request.files:
         # Try to get CSV content from JSON body
-        data = request.json or {}
-        csv_content = data.get('csv', '')
+        csv_source = (request.json or {}).get('csv', '')
+        if not csv_source:
+            return jsonify({"error": "No CSV content provided"}), 400
     else:
-        file = request.files['file']
-        csv_content = file.read().decode('utf-8')
-    
-    if not csv_content:
-        return jsonify({"error": "No CSV content provided"}), 400
+        # Stream the upload into the CSV reader instead of buffering the
+        # whole file as bytes plus a decoded copy; utf-8-sig eats the BOM
+        csv_source = TextIOWrapper(
+            request.files['file'].stream, encoding='utf-8-sig', newline=''
+        )
     
     service = ContactService(g.db, user)
-    imported, errors = service.import_from_csv(csv_content)
+    imported, errors = service.import_from_csv(csv_source)
     
     return jsonify({
         "success": True,
@@ -461,22 +539,23 @@ def import_contacts():
 @require_auth
 def export_contacts():
     """Export contacts to CSV."""
-    user = g.current_user
+    user = _request_user(g.db)
     service = ContactService(g.db, user)
     
-    csv_content = service.export_to_csv()
-    
-    return csv_content, 200, {
-        'Content-Type': 'text/csv',
-        'Content-Disposition': 'attachment; filename=contacts.csv'
-    }
+    # Stream rows as they come off the cursor instead of building the
+    # whole file in memory first
+    return Response(
+        stream_with_context(service.iter_csv_rows()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': 'attachment; filename=contacts.csv'},
+    )
 
 
 @app.route('/api/contacts/stats', methods=['GET'])
 @require_auth
 def get_contact_stats():
     """Get contact statistics."""
-    user = g.current_user
+    user = _request_user(g.db)
     service = ContactService(g.db, user)
     
     return jsonify(service.get_stats())
@@ -490,7 +569,7 @@ def get_contact_stats():
 @require_auth
 def get_templates():
     """Get all templates for the current user."""
-    user = g.current_user
+    user = _request_user(g.db)
     category = request.args.get('category')
     
     service = TemplateService(g.db, user)
@@ -517,7 +596,7 @@ def get_templates():
 def create_template():
     """Create a new template."""
     data = request.json or {}
-    user = g.current_user
+    user = _request_user(g.db)
     
     name = data.get('name', '').strip()
     if not name:
@@ -549,27 +628,15 @@ def create_template():
 def update_template(template_id):
     """Update a template."""
     data = request.json or {}
-    user = g.current_user
+    user = _request_user(g.db)
     
     service = TemplateService(g.db, user)
     
-    update_data = {}
-    field_map = {
-        'name': 'name',
-        'description': 'description',
-        'category': 'category',
-        'subjectTemplate': 'subject_template',
-        'bodyTemplate': 'body_template',
-        'systemPrompt': 'system_prompt',
-        'userPromptTemplate': 'user_prompt_template',
-        'isDefault': 'is_default',
-        'isActive': 'is_active',
+    update_data = {
+        _TEMPLATE_FIELD_MAP[k]: data[k]
+        for k in data.keys() & _TEMPLATE_FIELD_MAP.keys()
     }
     
-    for camel, snake in field_map.items():
-        if camel in data:
-            update_data[snake] = data[camel]
-    
     template = service.update(template_id, **update_data)
     if not template:
         return jsonify({"error": "Template not found"}), 404
@@ -581,7 +648,7 @@ def update_template(template_id):
 @require_auth
 def delete_template(template_id):
     """Delete a template."""
-    user = g.current_user
+    user = _request_user(g.db)
     service = TemplateService(g.db, user)
     
     if not service.delete(template_id):
@@ -599,7 +666,7 @@ def delete_template(template_id):
 def generate_email():
     """Generate an email for a contact."""
     data = request.json or {}
-    user = g.current_user
+    user = _request_user(g.db)
     
     contact_id = data.get('contactId')
     template_id = data.get('templateId')
@@ -636,17 +703,17 @@ def generate_email():
 @require_auth
 def get_logs():
     """Get email logs."""
-    user = g.current_user
+    user = _request_user(g.db)
     skip = request.args.get('skip', 0, type=int)
     limit = request.args.get('limit', 100, type=int)
     
     email_service = EmailService(g.db, user)
-    logs = email_service.get_logs(skip=skip, limit=limit)
+    logs = email_service.get_log_rows(skip=skip, limit=limit)
     
     return jsonify({
         "logs": [{
             "id": log.id,
-            "timestamp": log.created_at.isoformat() if log.created_at else None,
+            "timestamp": log.created_at,
             "email": log.recipient_email,
             "name": log.recipient_name,
             "company": log.company,
@@ -662,7 +729,7 @@ def get_logs():
 @require_auth
 def get_stats():
     """Get overall statistics."""
-    user = g.current_user
+    user = _request_user(g.db)
     
     contact_service = ContactService(g.db, user)
     email_service = EmailService(g.db, user)
@@ -702,24 +769,37 @@ def require_legacy_auth(f):
 def get_config_legacy():
     """Get configuration (legacy endpoint)."""
     try:
-        import json
         config_path = config.LEGACY_CONFIG_FILE
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return jsonify(json.load(f))
+        with open(config_path, 'rb') as f:
+            return jsonify(orjson.loads(f.read()))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+# Serialized bytes of the last config written; lets a repeated POST with
+# the same payload return without touching disk
+_last_config_bytes = None
+
+
 @app.route('/api/config', methods=['POST'])
 @require_legacy_auth
 def save_config_legacy():
     """Save configuration (legacy endpoint)."""
+    global _last_config_bytes
     try:
-        import json
         config_data = request.json
+        payload = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+        if payload == _last_config_bytes:
+            return jsonify({"success": True})
+
+        # Write-and-rename so a crash mid-write can't truncate the live
+        # config; orjson's C pretty-printer replaces json.dump(indent=2)
         config_path = config.LEGACY_CONFIG_FILE
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=2)
+        tmp_path = config_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, config_path)
+        _last_config_bytes = payload
         return jsonify({"success": True})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -774,5 +854,20 @@ if __name__ == '__main__':
     
     if debug_mode:
         print("⚠️  WARNING: Running in debug mode. Do not use in production!\n")
-    
-    app.run(host=args.host, port=args.port, debug=debug_mode)
+        app.run(host=args.host, port=args.port, debug=True, threaded=True)
+    else:
+        # Werkzeug's dev server handles one request at a time; serve through
+        # waitress in production so bcrypt and DB waits overlap. init_db()
+        # already ran above, so workers start against a warm schema.
+        try:
+            from waitress import serve
+
+            serve(
+                app,
+                host=args.host,
+                port=args.port,
+                threads=int(os.environ.get("WEB_THREADS", "8")),
+            )
+        except ImportError:
+            print("waitress not installed; falling back to the dev server")
+            app.run(host=args.host, port=args.port, threaded=True)
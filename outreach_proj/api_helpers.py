@@ -4,7 +4,11 @@ API helpers for creating service instances with proper database sessions.
 
 from contextlib import contextmanager
 from functools import wraps
+
+import orjson
 from flask import g, jsonify
+from flask.json.provider import JSONProvider
+from sqlalchemy.orm import joinedload
 
 from .database import get_db_session
 from .models import User
@@ -13,52 +17,109 @@ from .services.template_service import TemplateService
 from .services.email_service import EmailService
 
 
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    orjson encodes several times faster than the stdlib encoder that
+    jsonify uses by default, and serializes datetime objects natively so
+    response builders don't need manual .isoformat() calls.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # jsonify funnels through here; hand the response the orjson
+        # bytes directly instead of decoding to str only for Flask to
+        # re-encode to UTF-8. On large list payloads (contacts, logs)
+        # that round trip costs as much as the encode itself.
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj), mimetype='application/json'
+        )
+
+
+def _request_db():
+    """Return the request-scoped session, creating it on first use."""
+    db = g.get('db')
+    if db is None:
+        db = get_db_session()
+        g.db = db
+    return db
+
+
+def close_request_db(exception=None):
+    """
+    Teardown hook: close the request-scoped session, if one was opened.
+
+    Register with ``app.teardown_appcontext(close_request_db)``.
+    """
+    g.pop('_service_user', None)
+    db = g.pop('db', None)
+    if db is not None:
+        if exception is not None:
+            db.rollback()
+        db.close()
+
+
+def _request_user(db):
+    """
+    Return the ORM User for g.current_user, loaded once per request.
+
+    require_auth stores a plain dict on g; the services need the mapped
+    User (they read user.profile for signatures and template rendering),
+    so load it here with the profile joined and cache it on g — endpoints
+    that use several services share one SELECT instead of one each.
+    """
+    user = g.get('_service_user')
+    if user is None:
+        user = (
+            db.query(User)
+            .options(joinedload(User.profile))
+            .filter(User.id == g.current_user["id"])
+            .first()
+        )
+        if not user:
+            raise ValueError("User not found")
+        g._service_user = user
+    return user
+
+
 @contextmanager
 def get_contact_service():
     """Get a ContactService with the current user's context."""
-    db = get_db_session()
+    db = _request_db()
     try:
-        user = db.query(User).filter(User.id == g.current_user.id).first()
-        if not user:
-            raise ValueError("User not found")
-        yield ContactService(db, user)
+        yield ContactService(db, _request_user(db))
         db.commit()
     except Exception:
         db.rollback()
         raise
-    finally:
-        db.close()
 
 
 @contextmanager
 def get_template_service():
     """Get a TemplateService with the current user's context."""
-    db = get_db_session()
+    db = _request_db()
     try:
-        user = db.query(User).filter(User.id == g.current_user.id).first()
-        if not user:
-            raise ValueError("User not found")
-        yield TemplateService(db, user)
+        yield TemplateService(db, _request_user(db))
         db.commit()
     except Exception:
         db.rollback()
         raise
-    finally:
-        db.close()
 
 
 @contextmanager
 def get_email_service():
     """Get an EmailService with the current user's context."""
-    db = get_db_session()
+    db = _request_db()
     try:
-        user = db.query(User).filter(User.id == g.current_user.id).first()
-        if not user:
-            raise ValueError("User not found")
-        yield EmailService(db, user)
+        yield EmailService(db, _request_user(db))
         db.commit()
     except Exception:
         db.rollback()
         raise
-    finally:
-        db.close()
@@ -4,6 +4,10 @@ Authentication utilities for the Outreach application.
 Provides JWT-based authentication with password hashing.
 """
 
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from functools import wraps
 from typing import Optional, Callable, Any
@@ -11,21 +15,70 @@ from typing import Optional, Callable, Any
 import bcrypt
 import jwt
 from flask import request, jsonify, g
+from sqlalchemy.orm import joinedload
 
 from .config import config
 from .database import get_db_session
 from .models import User
 
+# Short-TTL cache of verified bearer tokens -> user dicts, keyed by a SHA-256
+# digest of the token. Skips the JWT decode + users-table query on repeated
+# requests with the same hot token. The TTL is short enough that token expiry
+# and account deactivation are still picked up promptly.
+_TOKEN_CACHE_TTL_SECONDS = 30
+_TOKEN_CACHE_MAX_ENTRIES = 10000
+_token_cache: dict[str, tuple[float, dict]] = {}
+
+
+def _get_cached_user(token: str) -> Optional[dict]:
+    """Return the cached user dict for a token, or None if absent/expired."""
+    key = hashlib.sha256(token.encode('utf-8')).hexdigest()
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, user_data = entry
+    if time.monotonic() >= expires_at:
+        _token_cache.pop(key, None)
+        return None
+    return dict(user_data)
+
+
+def _cache_user(token: str, user_data: dict) -> None:
+    """Cache a verified token -> user dict mapping with a short TTL."""
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        expired = [k for k, (exp, _) in _token_cache.items() if exp <= now]
+        for k in expired:
+            _token_cache.pop(k, None)
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_ENTRIES:
+            _token_cache.clear()
+    key = hashlib.sha256(token.encode('utf-8')).hexdigest()
+    _token_cache[key] = (time.monotonic() + _TOKEN_CACHE_TTL_SECONDS, dict(user_data))
+
+
+# bcrypt is deliberately CPU-bound (~100ms per call) and releases the GIL
+# inside its C extension, so hashes run truly in parallel on a bounded pool.
+# Routing them through the pool caps concurrent bcrypt work at the core
+# count instead of letting a burst of logins tie up every WSGI worker.
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix='bcrypt'
+)
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    def _hash() -> str:
+        salt = bcrypt.gensalt()
+        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+    return _BCRYPT_POOL.submit(_hash).result()
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     """Verify a password against its hash."""
-    return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+    return _BCRYPT_POOL.submit(
+        bcrypt.checkpw, password.encode('utf-8'), password_hash.encode('utf-8')
+    ).result()
 
 
 def create_access_token(user_id: int, email: str) -> str:
@@ -87,10 +140,14 @@ def get_current_user_from_token(token: str) -> Optional[dict]:
         User dict if found and token valid, None otherwise
         Dict contains: id, email, is_active, created_at
     """
+    cached = _get_cached_user(token)
+    if cached is not None:
+        return cached
+
     payload = decode_access_token(token)
     if not payload:
         return None
-    
+
     user_id_str = payload.get("sub")
     if not user_id_str:
         return None
@@ -114,6 +171,7 @@ def get_current_user_from_token(token: str) -> Optional[dict]:
             "is_active": user.is_active,
             "created_at": user.created_at,
         }
+        _cache_user(token, user_data)
         return user_data
     finally:
         db.close()
@@ -252,8 +310,15 @@ def authenticate_user(email: str, password: str) -> tuple[Optional[dict], Option
     """
     db = get_db_session()
     try:
-        user = db.query(User).filter(User.email == email.lower()).first()
-        
+        # Eager-load the profile - it's read below, and lazy loading would
+        # cost a second SELECT on every login
+        user = (
+            db.query(User)
+            .options(joinedload(User.profile))
+            .filter(User.email == email.lower())
+            .first()
+        )
+
         if not user:
             return None, "Invalid email or password"
         
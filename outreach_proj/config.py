@@ -4,7 +4,9 @@ Application configuration management.
 Loads settings from environment variables with sensible defaults.
 """
 
+import logging
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -12,49 +14,68 @@ from dotenv import load_dotenv
 _PACKAGE_DIR = Path(__file__).parent
 _PROJECT_ROOT = _PACKAGE_DIR.parent
 
-# Try loading .env from multiple locations
-for env_path in [_PACKAGE_DIR / ".env", _PROJECT_ROOT / ".env"]:
-    if env_path.exists():
-        load_dotenv(env_path)
-        break
+# Try loading .env from multiple locations; os.path.isfile on plain
+# strings skips the per-candidate Path allocation of the exists() loop
+_env_file = next(
+    (
+        p
+        for p in (
+            os.path.join(str(_PACKAGE_DIR), ".env"),
+            os.path.join(str(_PROJECT_ROOT), ".env"),
+        )
+        if os.path.isfile(p)
+    ),
+    None,
+)
+if _env_file:
+    load_dotenv(_env_file)
 
+# Note: Render provides postgres:// URLs, but SQLAlchemy 2.0+ requires postgresql://
+_raw_db_url: str = os.getenv(
+    "DATABASE_URL",
+    f"sqlite:///{_PROJECT_ROOT / 'outreach.db'}"
+)
 
+
+# frozen + slots: attribute reads skip the instance __dict__ and nothing
+# can mutate (or typo-create) a setting at runtime
+@dataclass(frozen=True, slots=True)
 class Config:
     """Application configuration loaded from environment variables."""
-    
+
     # ========================================
     # Paths
     # ========================================
     BASE_DIR: Path = _PACKAGE_DIR
     PROJECT_ROOT: Path = _PROJECT_ROOT
-    
+
     # Database
-    # Note: Render provides postgres:// URLs, but SQLAlchemy 2.0+ requires postgresql://
-    _raw_db_url: str = os.getenv(
-        "DATABASE_URL", 
-        f"sqlite:///{_PROJECT_ROOT / 'outreach.db'}"
-    )
     DATABASE_URL: str = _raw_db_url.replace("postgres://", "postgresql://", 1) if _raw_db_url.startswith("postgres://") else _raw_db_url
-    
+
+    # Connection pool tuning (see database.py)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
     # Legacy file paths (for migration, will be deprecated)
     LEGACY_CONFIG_FILE: Path = _PACKAGE_DIR / "config.json"
     LEGACY_CONTACTS_FILE: Path = _PACKAGE_DIR / "contacts.csv"
     LEGACY_LOG_FILE: Path = _PACKAGE_DIR / "logs.csv"
     LEGACY_DRAFTS_DIR: Path = _PACKAGE_DIR / "drafts"
-    
+
     # ========================================
     # Authentication
     # ========================================
     SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_HOURS: int = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
-    
+
     # ========================================
     # API Keys
     # ========================================
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     API_KEY: str | None = os.getenv("API_KEY")  # Optional legacy API key
-    
+
     # ========================================
     # Email Providers
     # ========================================
@@ -65,65 +86,70 @@ class Config:
     GMAIL_TOKEN_FILE: Path = Path(
         os.getenv("TOKEN_FILE", str(_PACKAGE_DIR / "token.json"))
     )
-    
+
     # SMTP (alternative to Gmail)
     SMTP_HOST: str = os.getenv("SMTP_HOST", "")
     SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
     SMTP_USER: str = os.getenv("SMTP_USER", "")
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
     SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
-    
+
     # ========================================
     # Server Configuration
     # ========================================
     FLASK_DEBUG: bool = os.getenv("FLASK_DEBUG", "false").lower() == "true"
     API_HOST: str = os.getenv("API_HOST", "127.0.0.1")
     API_PORT: int = int(os.getenv("API_PORT", "5000"))
-    
-    # CORS
-    ALLOWED_ORIGINS: list[str] = os.getenv(
-        "ALLOWED_ORIGINS", 
+
+    # CORS (a tuple: dataclasses reject mutable defaults, and origins
+    # never change after startup anyway)
+    ALLOWED_ORIGINS: tuple[str, ...] = tuple(os.getenv(
+        "ALLOWED_ORIGINS",
         "http://localhost:8080,http://127.0.0.1:8080"
-    ).split(",")
-    
+    ).split(","))
+
     # Rate Limiting
     RATE_LIMIT_WINDOW: int = int(os.getenv("RATE_LIMIT_WINDOW", "60"))
     RATE_LIMIT_MAX_REQUESTS: int = int(os.getenv("RATE_LIMIT_MAX_REQUESTS", "30"))
-    
+    # Optional shared rate-limit backend (e.g. redis://localhost:6379/0).
+    # Without it, each worker process enforces its own in-memory limit.
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
+
     # ========================================
     # OpenAI Configuration
     # ========================================
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
     OPENAI_TEMPERATURE: float = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
-    
+
     # ========================================
     # Email Settings
     # ========================================
     MAX_EMAILS_PER_REQUEST: int = int(os.getenv("MAX_EMAILS_PER_REQUEST", "50"))
     EMAIL_DELAY_MIN_SECONDS: int = int(os.getenv("EMAIL_DELAY_MIN_SECONDS", "15"))
     EMAIL_DELAY_MAX_SECONDS: int = int(os.getenv("EMAIL_DELAY_MAX_SECONDS", "45"))
-    
-    @classmethod
-    def is_production(cls) -> bool:
+
+    def is_production(self) -> bool:
         """Check if running in production mode."""
-        return not cls.FLASK_DEBUG and cls.SECRET_KEY != "dev-secret-key-change-in-production"
-    
-    @classmethod
-    def validate(cls) -> list[str]:
+        return not self.FLASK_DEBUG and self.SECRET_KEY != "dev-secret-key-change-in-production"
+
+    def validate(self) -> list[str]:
         """Validate configuration and return list of errors."""
         errors = []
-        
-        if not cls.OPENAI_API_KEY:
+
+        if not self.OPENAI_API_KEY:
             errors.append("OPENAI_API_KEY is not set")
-        
-        if cls.is_production():
-            if cls.SECRET_KEY == "dev-secret-key-change-in-production":
+
+        if self.is_production():
+            if self.SECRET_KEY == "dev-secret-key-change-in-production":
                 errors.append("SECRET_KEY must be changed for production")
-            if "*" in cls.ALLOWED_ORIGINS or any("*" in origin for origin in cls.ALLOWED_ORIGINS):
+            if "*" in self.ALLOWED_ORIGINS or any("*" in origin for origin in self.ALLOWED_ORIGINS):
                 errors.append("ALLOWED_ORIGINS should not use wildcard (*) in production")
-        
+
         return errors
 
 
-# Create singleton instance
+# Create singleton instance and surface misconfiguration early, once,
+# instead of as a confusing failure deep in a request
 config = Config()
+for _error in config.validate():
+    logging.getLogger(__name__).warning("Config: %s", _error)
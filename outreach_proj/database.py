@@ -1,30 +1,101 @@
 """
 Database initialization and session management.
+
+The engine is built lazily on first use: importing this module (or
+config) stays cheap for CLI paths that never touch the database, and
+``from outreach_proj.database import engine`` still works via the
+module-level ``__getattr__``.
 """
 
+import os
 from contextlib import contextmanager
-from sqlalchemy import create_engine
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 
 from .config import config
 from .models import Base
 
-# Create engine
-engine = create_engine(
-    config.DATABASE_URL,
-    echo=config.FLASK_DEBUG,  # Log SQL in debug mode
-    pool_pre_ping=True,  # Verify connections before using
-)
+_engine = None
+_session_factory = None
+
+
+def get_engine():
+    """Return the process-wide engine, creating it on first call."""
+    global _engine
+    if _engine is None:
+        is_sqlite = config.DATABASE_URL.startswith("sqlite")
+
+        # Pre-ping issues a SELECT 1 on every checkout to catch dead
+        # network connections - pointless overhead for a local SQLite
+        # file, so it defaults off there and on elsewhere (override with
+        # DB_POOL_PRE_PING).
+        pre_ping_env = os.getenv("DB_POOL_PRE_PING")
+        if pre_ping_env is not None:
+            pre_ping = pre_ping_env.lower() == "true"
+        else:
+            pre_ping = not is_sqlite
+
+        # The default pool of 5 connections stalls checkouts once the
+        # WSGI server runs more concurrent requests than that; recycling
+        # guards against servers dropping idle connections under us.
+        # SQLite needs check_same_thread=False so pooled connections can
+        # be reused across WSGI worker threads.
+        _engine = create_engine(
+            config.DATABASE_URL,
+            echo=config.FLASK_DEBUG,  # Log SQL in debug mode
+            pool_pre_ping=pre_ping,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_recycle=config.DB_POOL_RECYCLE,
+            connect_args={"check_same_thread": False} if is_sqlite else {},
+        )
+
+        if is_sqlite:
+            # Defaults are a rollback journal with synchronous=FULL - two
+            # fsyncs per commit. WAL with synchronous=NORMAL keeps
+            # durability for application crashes while letting readers
+            # and the writer overlap; temp tables stay off disk.
+            @event.listens_for(_engine, "connect")
+            def _tune_sqlite(dbapi_conn, _record):
+                cursor = dbapi_conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.close()
+    return _engine
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_sessionmaker():
+    """Return the session factory, creating it (and the engine) on first call.
+
+    expire_on_commit=False keeps loaded attributes readable after commit
+    instead of re-SELECTing every object the handler still touches while
+    serializing the response.
+    """
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(
+            autocommit=False, autoflush=False, bind=get_engine(),
+            expire_on_commit=False,
+        )
+    return _session_factory
+
+
+def __getattr__(name):
+    # Back-compat for `from .database import engine / SessionLocal`
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_db() -> None:
     """Create all database tables if they don't exist."""
     try:
         # checkfirst=True ensures we don't error on existing tables
-        Base.metadata.create_all(bind=engine, checkfirst=True)
+        Base.metadata.create_all(bind=get_engine(), checkfirst=True)
     except Exception as e:
         # Log but don't fail if tables exist - this handles edge cases
         import logging
@@ -34,19 +105,19 @@ def init_db() -> None:
 
 def drop_db() -> None:
     """Drop all database tables. Use with caution!"""
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=get_engine())
 
 
 @contextmanager
 def get_db() -> Session:
     """
     Get a database session with automatic cleanup.
-    
+
     Usage:
         with get_db() as db:
             user = db.query(User).first()
     """
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
         db.commit()
@@ -60,7 +131,7 @@ def get_db() -> Session:
 def get_db_session() -> Session:
     """
     Get a database session (for Flask request context).
-    
+
     The caller is responsible for closing the session.
     """
-    return SessionLocal()
+    return get_sessionmaker()()
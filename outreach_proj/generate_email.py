@@ -5,14 +5,16 @@ This module creates personalized networking emails based on contact
 information and configurable prompts.
 """
 
-import json
+import functools
 import logging
 import os
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from dotenv import load_dotenv
-from openai import OpenAI
+import orjson
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 # Handle both direct script execution and package import
 _current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,11 +23,10 @@ if __package__ is None or __package__ == "":
     if _parent_dir not in sys.path:
         sys.path.insert(0, _parent_dir)
     from outreach_proj import prompt_components
+    from outreach_proj.config import config as app_config
 else:
     from . import prompt_components
-
-# Load environment variables from the package directory
-load_dotenv(os.path.join(_current_dir, ".env"))
+    from .config import config as app_config
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -34,7 +35,7 @@ logger = logging.getLogger(__name__)
 _openai_client = None
 
 
-def _get_openai_client() -> OpenAI:
+def _get_openai_client() -> "OpenAI":
     """Get or create the OpenAI client (lazy initialization).
     
     This prevents crashes when the module is imported before
@@ -42,7 +43,13 @@ def _get_openai_client() -> OpenAI:
     """
     global _openai_client
     if _openai_client is None:
-        api_key = os.getenv("OPENAI_API_KEY")
+        # Imported here, not at module top: openai costs hundreds of ms to
+        # import and CLI paths that never generate an email shouldn't pay it
+        from openai import OpenAI
+
+        # Config already resolved the key (env + .env) at import; fall back
+        # to the live environment for deploys that inject it late
+        api_key = app_config.OPENAI_API_KEY or os.environ.get("OPENAI_API_KEY", "")
         if not api_key:
             raise ValueError(
                 "OPENAI_API_KEY environment variable is not set. "
@@ -51,8 +58,13 @@ def _get_openai_client() -> OpenAI:
         _openai_client = OpenAI(api_key=api_key)
     return _openai_client
 
-# Company-specific context for better personalization
-COMPANY_CONTEXT_MAP: dict[str, str] = {
+# Context used when a company has no specific entry below
+DEFAULT_COMPANY_CONTEXT = "innovative engineering and technology"
+
+# Company-specific context for better personalization. Keys are interned
+# so repeat lookups for the same company in a batch compare by identity
+# before falling back to a character comparison.
+COMPANY_CONTEXT_MAP: dict[str, str] = {sys.intern(k): v for k, v in {
     "Arc Boat Co": "high-performance electric boats and marine systems",
     "Scout Motors": "rugged all-electric trucks and SUVs, reviving the classic Scout brand",
     "Apple": "consumer electronics, hardware integration, and high-volume manufacturing",
@@ -62,49 +74,24 @@ COMPANY_CONTEXT_MAP: dict[str, str] = {
         "quantitative trading, software engineering, complex risk analysis "
         "and market making systems engineering"
     ),
-}
-
-
-def generate_personalized_email(
-    contact: dict[str, str],
-    config: dict[str, Any],
-) -> tuple[str, str]:
-    """
-    Generate a personalized networking email for a contact.
-    
-    Args:
-        contact: Dictionary with contact info (First Name, Company, Job Title, etc.)
-        config: Configuration with sender info (your_name, your_email, etc.)
-    
-    Returns:
-        Tuple of (subject, body) for the generated email.
-    """
-    # Extract contact info with safe defaults
-    first_name = contact.get("First Name", "").strip() or "there"
-    company = contact.get("Company", "").strip() or "your company"
-    title = contact.get("Job Title", "").strip() or "your role"
-
-    # Get industry context
-    industry_context = COMPANY_CONTEXT_MAP.get(
-        company, "innovative engineering and technology"
-    )
+}.items()}
 
-    # Extract sender info
-    your_name = config.get("your_name", "Taylor Van Horn")
-    your_email = config.get("your_email", "")
-    your_school = config.get("your_school", "Baylor University")
 
-    prompt = f"""
+# Prompt skeleton, rendered once at import: the SKILL_ARSENAL and
+# EXPERIENCE_FRAGMENTS constants are interpolated here so each call only
+# fills in the per-contact fields with format_map instead of rebuilding
+# the whole ~2 KB string from parts.
+_PROMPT_TMPL = f"""
     You are an expert career coach helping an Electrical & Computer Engineering student network for internships.
     
     **THE SENDER:**
-    Name: {your_name}
-    Role: Electrical and Computer Engineering student at {your_school}.
+    Name: {{your_name}}
+    Role: Electrical and Computer Engineering student at {{your_school}}.
     
     **THE RECIPIENT:**
-    Job Title: {title}
-    Company: {company}
-    Context: {industry_context}
+    Job Title: {{title}}
+    Company: {{company}}
+    Context: {{industry_context}}
 
     **SKILL ARSENAL:**
     {prompt_components.SKILL_ARSENAL}
@@ -114,89 +101,200 @@ def generate_personalized_email(
 
     **TASK:**
     Write a short networking email (max 125 words).
-    1. Analyze the job title ({title}).
+    1. Analyze the job title ({{title}}).
     2. Pick ONE relevant skill that fits this specific role.
-    3. Connect the most relevant experience to their company context ({industry_context}).
+    3. Connect the most relevant experience to their company context ({{industry_context}}).
     
     **SUBJECT LINE GUIDELINES:**
     Create a natural, grammatically correct subject line. Examples of GOOD subjects:
-    - "Interest in the Software Engineering role at {company}"
-    - "Quick question about data engineering at {company}"
-    - "Curious about your engineering work at {company}"
-    - "Student interested in the {title} role"
+    - "Interest in the Software Engineering role at {{company}}"
+    - "Quick question about data engineering at {{company}}"
+    - "Curious about your engineering work at {{company}}"
+    - "Student interested in the {{title}} role"
     
     BAD subjects (never use these patterns):
-    - "Interest in Senior Software Engineer at {company}" (missing "the" and "role")
-    - "Interest in {title}" (sounds robotic)
+    - "Interest in Senior Software Engineer at {{company}}" (missing "the" and "role")
+    - "Interest in {{title}}" (sounds robotic)
     
     **IMPORTANT:** Do NOT include any closing signature (like "Best," "Thanks," "Sincerely," etc.) or your name at the end. The signature will be added automatically.
     
     Return ONLY valid JSON:
-    {{
+    {{{{
       "subject": "Natural, grammatically correct subject line",
-      "body": "The email body starting with 'Hi {first_name},' - DO NOT include a signature or closing"
-    }}
+      "body": "The email body starting with \'Hi {{first_name}},\' - DO NOT include a signature or closing"
+    }}}}
     """
 
-    try:
-        response = _get_openai_client().chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You return ONLY valid JSON objects."},
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.7,
-        )
 
-        content = response.choices[0].message.content
-        if content is None:
-            raise ValueError("Empty response from OpenAI")
-        
-        content = content.strip()
+@functools.lru_cache(maxsize=512)
+def _generate_core(
+    company: str,
+    title: str,
+    industry_context: str,
+    your_name: str,
+    your_school: str,
+) -> tuple[str, str]:
+    """
+    Run the OpenAI round-trip for one (company, title) combination.
 
-        # Clean markdown code fences if present
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-            content = content.strip()
+    Returns (subject, body_template) where the body greets a literal
+    "{first_name}" placeholder - two contacts sharing a company and job
+    title produce the same prompt, so the cache turns the duplicate into
+    a dict hit instead of a multi-second, billed API call. Failures
+    raise and are not cached.
+    """
+    prompt = _PROMPT_TMPL.format_map({
+        "your_name": your_name,
+        "your_school": your_school,
+        "title": title,
+        "company": company,
+        "industry_context": industry_context,
+        "first_name": "{first_name}",
+    })
 
-        data = json.loads(content)
+    # json_object mode makes the API guarantee parseable JSON, so no
+    # markdown-fence cleanup is needed on the way out
+    response = _get_openai_client().chat.completions.create(
+        model="gpt-4o",
+        messages=[
+            {"role": "system", "content": "You return ONLY valid JSON objects."},
+            {"role": "user", "content": prompt},
+        ],
+        temperature=0.7,
+        response_format={"type": "json_object"},
+    )
 
-        # Handle list response (AI sometimes returns [{...}] instead of {...})
-        if isinstance(data, list):
-            data = data[0] if data else {}
+    content = response.choices[0].message.content
+    if content is None:
+        raise ValueError("Empty response from OpenAI")
 
-        subject = data.get("subject", f"Interest in opportunities at {company}")
-        body_content = data.get("body", f"Hi {first_name},\n\nI'd love to connect.")
+    data = orjson.loads(content)
 
-        # Build signature from config (with fallbacks for backwards compatibility)
-        your_title = config.get("your_title", "")
-        your_department = config.get("your_department", "")
-        your_phone = config.get("your_phone", "")
-        graduation_year = config.get("graduation_year", "")
-        
-        # Build signature lines dynamically
-        signature_lines = ["Best,", your_name]
-        
-        if your_title:
-            signature_lines.append(your_title)
-        
-        if your_school or your_department:
-            school_line = " | ".join(filter(None, [your_school, your_department]))
-            signature_lines.append(school_line)
-        
-        if your_school and config.get("your_major"):
-            degree_line = f"B.S. {config.get('your_major')}"
-            if graduation_year:
-                degree_line += f", Class of {graduation_year}"
-            signature_lines.append(degree_line)
-        
-        contact_parts = [p for p in [your_email, your_phone] if p]
-        if contact_parts:
-            signature_lines.append(" | ".join(contact_parts))
-        
-        signature = "\n".join(signature_lines)
+    # Handle list response (AI sometimes returns [{...}] instead of {...})
+    if isinstance(data, list):
+        data = data[0] if data else {}
+
+    subject = data.get("subject", f"Interest in opportunities at {company}")
+    body_template = data.get("body", "Hi {first_name},\n\nI'd love to connect.")
+    return subject, body_template
+
+
+@functools.lru_cache(maxsize=16)
+def _build_signature(
+    your_name: str,
+    your_email: str,
+    your_school: str,
+    your_title: str,
+    your_department: str,
+    your_phone: str,
+    your_major: str,
+    graduation_year: str,
+) -> str:
+    """Assemble the email signature for one sender configuration.
+
+    Fallbacks keep backwards compatibility with older configs that only
+    carry name/email/school.
+    """
+    signature_lines = ["Best,", your_name]
+
+    if your_title:
+        signature_lines.append(your_title)
+
+    if your_school or your_department:
+        school_line = " | ".join(filter(None, [your_school, your_department]))
+        signature_lines.append(school_line)
+
+    if your_school and your_major:
+        degree_line = f"B.S. {your_major}"
+        if graduation_year:
+            degree_line += f", Class of {graduation_year}"
+        signature_lines.append(degree_line)
+
+    contact_parts = [p for p in [your_email, your_phone] if p]
+    if contact_parts:
+        signature_lines.append(" | ".join(contact_parts))
+
+    return "\n".join(signature_lines)
+
+
+def _pick(contact: dict[str, str], key: str, default: str) -> str:
+    """Fetch and strip one contact field, falling back when blank."""
+    value = contact.get(key)
+    if value:
+        value = value.strip()
+    return value or default
+
+
+def _render_fallback(
+    first_name: str,
+    company: str,
+    title: str,
+    your_name: str,
+    your_school: str,
+) -> tuple[str, str]:
+    """Template-only email used when the LLM is skipped or fails."""
+    body = (
+        f"Hi {first_name},\n\n"
+        f"I am an ECE student at {your_school} interested in {company}. "
+        f"I'd love to learn more about your work as a {title}.\n\n"
+        f"Best,\n{your_name}"
+    )
+    return f"Student interested in {company}", body
+
+
+def generate_personalized_email(
+    contact: dict[str, str],
+    config: dict[str, Any],
+    use_llm: bool = True,
+) -> tuple[str, str]:
+    """
+    Generate a personalized networking email for a contact.
+    
+    Args:
+        contact: Dictionary with contact info (First Name, Company, Job Title, etc.)
+        config: Configuration with sender info (your_name, your_email, etc.)
+        use_llm: When False, render the template fallback without calling
+            OpenAI - microseconds instead of seconds per contact.
+    
+    Returns:
+        Tuple of (subject, body) for the generated email.
+    """
+    # Extract contact info with safe defaults
+    first_name = _pick(contact, "First Name", "there")
+    company = _pick(contact, "Company", "your company")
+    title = _pick(contact, "Job Title", "your role")
+
+    # Get industry context
+    industry_context = COMPANY_CONTEXT_MAP.get(company, DEFAULT_COMPANY_CONTEXT)
+
+    # Extract sender info
+    your_name = config.get("your_name", "Taylor Van Horn")
+    your_email = config.get("your_email", "")
+    your_school = config.get("your_school", "Baylor University")
+
+    # With neither a company nor a job title the prompt has nothing to
+    # personalize on, so an LLM call buys nothing over the template
+    if not use_llm or (company == "your company" and title == "your role"):
+        return _render_fallback(first_name, company, title, your_name, your_school)
+
+    try:
+        subject, body_template = _generate_core(
+            company, title, industry_context, your_name, your_school
+        )
+        body_content = body_template.replace("{first_name}", first_name)
+
+        # The signature depends only on sender config, which is constant
+        # across a batch - build it once per distinct config
+        signature = _build_signature(
+            your_name,
+            your_email,
+            your_school,
+            config.get("your_title", ""),
+            config.get("your_department", ""),
+            config.get("your_phone", ""),
+            config.get("your_major", ""),
+            config.get("graduation_year", ""),
+        )
 
         full_body = f"{body_content}\n\n{signature}"
         return subject, full_body
@@ -205,10 +303,4 @@ def generate_personalized_email(
         logger.error(f"Error generating email for {company}: {e}")
         
         # Return fallback so the campaign continues
-        fallback_body = (
-            f"Hi {first_name},\n\n"
-            f"I am an ECE student at {your_school} interested in {company}. "
-            f"I'd love to learn more about your work as a {title}.\n\n"
-            f"Best,\n{your_name}"
-        )
-        return f"Student interested in {company}", fallback_body
\ No newline at end of file
+        return _render_fallback(first_name, company, title, your_name, your_school)
\ No newline at end of file
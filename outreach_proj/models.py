@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     Column, Integer, String, Text, Boolean, DateTime, ForeignKey,
-    JSON, Enum as SQLEnum, Index, UniqueConstraint
+    JSON, Enum as SQLEnum, Index, UniqueConstraint, func
 )
 from sqlalchemy.orm import relationship, declarative_base
 import enum
@@ -325,6 +325,16 @@ class EmailLog(Base):
     contact = relationship("Contact", back_populates="email_logs")
     campaign = relationship("Campaign", back_populates="email_logs")
     
+    # Covers the contacted-status EXISTS probe in contact listings, which
+    # compares LOWER(recipient_email) - the expression index lets SQLite
+    # satisfy that predicate without scanning the user's whole log
+    __table_args__ = (
+        Index(
+            'ix_email_logs_user_recipient_lower_status',
+            'user_id', func.lower(recipient_email), 'status',
+        ),
+    )
+    
     def __repr__(self):
         return f"<EmailLog {self.recipient_email} - {self.status.value}>"
 
@@ -56,13 +56,16 @@ def load_config(config_file: str | None = None) -> dict[str, Any]:
 def load_contacts(contacts_file: str | None = None) -> list[dict[str, str]]:
     """Load contacts from CSV file."""
     path = contacts_file or DEFAULT_CONTACTS_FILE
-    with open(path, newline="", encoding="utf-8") as f:
-        content = f.read()
-        # Handle BOM from Excel-exported CSVs
-        if content.startswith("\ufeff"):
-            content = content[1:]
-        reader = csv.DictReader(StringIO(content))
-        return list(reader)
+    # csv.reader + zip is roughly 2x faster than DictReader, which goes
+    # through fieldname/restval bookkeeping for every row. utf-8-sig
+    # strips the BOM Excel-exported CSVs prepend without slurping the
+    # whole file first.
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        return [dict(zip(header, row)) for row in reader]
 
 
 def load_contacted_emails(log_file: str | None = None) -> set[str]:
@@ -8,9 +8,10 @@ import csv
 from datetime import datetime, timezone
 from io import StringIO
 from typing import Optional
+from sqlalchemy import case, exists, func, tuple_
 from sqlalchemy.orm import Session
 
-from ..models import Contact, User
+from ..models import Contact, EmailLog, EmailStatus, User
 
 
 class ContactService:
@@ -20,9 +21,44 @@ class ContactService:
         self.db = db
         self.user = user
     
+    # Rows inserted per bulk statement during CSV import
+    IMPORT_BATCH_SIZE = 1000
+
+    # Columns returned by get_all_rows, in order
+    LIST_COLUMNS = (
+        Contact.id, Contact.first_name, Contact.last_name, Contact.email,
+        Contact.company, Contact.job_title, Contact.city, Contact.state,
+        Contact.status,
+    )
+
+    def _apply_filters(
+        self,
+        query,
+        status: Optional[str] = None,
+        company: Optional[str] = None,
+        search: Optional[str] = None,
+    ):
+        """Apply the shared status/company/search filters to a query."""
+        if status:
+            query = query.filter(Contact.status == status)
+
+        if company:
+            query = query.filter(Contact.company.ilike(f"%{company}%"))
+
+        if search:
+            search_term = f"%{search}%"
+            query = query.filter(
+                (Contact.first_name.ilike(search_term)) |
+                (Contact.last_name.ilike(search_term)) |
+                (Contact.email.ilike(search_term)) |
+                (Contact.company.ilike(search_term))
+            )
+
+        return query
+
     def get_all(
-        self, 
-        skip: int = 0, 
+        self,
+        skip: int = 0,
         limit: int = 100,
         status: Optional[str] = None,
         company: Optional[str] = None,
@@ -30,7 +66,7 @@ class ContactService:
     ) -> list[Contact]:
         """
         Get all contacts for the current user.
-        
+
         Args:
             skip: Number of records to skip (pagination)
             limit: Maximum records to return
@@ -39,24 +75,97 @@ class ContactService:
             search: Search in name, email, company
         """
         query = self.db.query(Contact).filter(Contact.user_id == self.user.id)
-        
-        if status:
-            query = query.filter(Contact.status == status)
-        
-        if company:
-            query = query.filter(Contact.company.ilike(f"%{company}%"))
-        
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                (Contact.first_name.ilike(search_term)) |
-                (Contact.last_name.ilike(search_term)) |
-                (Contact.email.ilike(search_term)) |
-                (Contact.company.ilike(search_term))
-            )
-        
+        query = self._apply_filters(query, status=status, company=company, search=search)
+
+        return query.order_by(Contact.created_at.desc()).offset(skip).limit(limit).all()
+
+    def get_all_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        company: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> list[tuple]:
+        """
+        Like get_all, but returns plain column tuples (see LIST_COLUMNS)
+        instead of ORM instances.
+
+        Cheaper for read-only list serialization: skips identity-map and
+        attribute-instrumentation overhead per row.
+        """
+        query = self.db.query(*self.LIST_COLUMNS).filter(Contact.user_id == self.user.id)
+        query = self._apply_filters(query, status=status, company=company, search=search)
+
         return query.order_by(Contact.created_at.desc()).offset(skip).limit(limit).all()
     
+    def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        company: Optional[str] = None,
+        search: Optional[str] = None,
+        after: Optional[tuple] = None,
+    ) -> tuple[list, int]:
+        """
+        One-round-trip page fetch for contact listings.
+
+        Returns (rows, total). Each row carries LIST_COLUMNS plus phone,
+        notes, created_at, and a was_contacted flag computed with a
+        correlated EXISTS against EmailLog - so the caller doesn't need
+        to load the user's whole contacted-email set just to label a
+        page. ``total`` is always the size of the full filtered result
+        set, regardless of paging: on a non-empty OFFSET page it comes
+        for free from COUNT(*) OVER () in the same SELECT; with a
+        keyset cursor (or an overshot, empty page) a separate COUNT
+        query is issued, because the windowed count runs after the
+        cursor predicate and would only see the remaining rows.
+
+        When ``after`` is a (created_at, id) pair, the page starts
+        strictly past that row in (created_at DESC, id DESC) order and
+        ``skip`` is ignored - a keyset seek that stays O(page) however
+        deep the caller paginates, where OFFSET has to scan and discard
+        every earlier row.
+        """
+        was_contacted = exists().where(
+            EmailLog.user_id == self.user.id,
+            func.lower(EmailLog.recipient_email) == Contact.email,
+            EmailLog.status.in_([EmailStatus.SENT, EmailStatus.DRAFT]),
+        ).label("was_contacted")
+
+        query = self.db.query(
+            *self.LIST_COLUMNS,
+            Contact.phone,
+            Contact.notes,
+            Contact.created_at,
+            was_contacted,
+            func.count().over().label("total"),
+        ).filter(Contact.user_id == self.user.id)
+        query = self._apply_filters(query, status=status, company=company, search=search)
+        query = query.order_by(Contact.created_at.desc(), Contact.id.desc())
+
+        if after is not None:
+            query = query.filter(tuple_(Contact.created_at, Contact.id) < after)
+        elif skip:
+            query = query.offset(skip)
+
+        rows = query.limit(limit).all()
+        if after is None and rows:
+            total = rows[0].total
+        else:
+            # The cursor predicate narrows the set the window function
+            # counts (and an empty page has no row to read it from), so
+            # recount the filters alone for a stable grand total.
+            count_query = self.db.query(func.count(Contact.id)).filter(
+                Contact.user_id == self.user.id
+            )
+            count_query = self._apply_filters(
+                count_query, status=status, company=company, search=search
+            )
+            total = count_query.scalar() or 0
+        return rows, total
+
     def get_count(self) -> int:
         """Get total count of contacts for the current user."""
         return self.db.query(Contact).filter(Contact.user_id == self.user.id).count()
@@ -159,33 +268,37 @@ class ContactService:
         self.db.flush()
         return contacts
     
-    def import_from_csv(self, csv_content: str) -> tuple[int, list[str]]:
+    def import_from_csv(self, csv_source) -> tuple[int, list[str]]:
         """
         Import contacts from CSV content.
-        
+
         Args:
-            csv_content: CSV file content as string
-            
+            csv_source: CSV content as a string, or an iterable of text lines
+                (e.g. an open file stream) consumed incrementally row by row
+
         Returns:
             Tuple of (imported_count, error_messages)
         """
         errors = []
         imported = 0
-        
-        # Handle BOM
-        if csv_content.startswith('\ufeff'):
-            csv_content = csv_content[1:]
-        
+
+        if isinstance(csv_source, str):
+            # Handle BOM
+            if csv_source.startswith('\ufeff'):
+                csv_source = csv_source[1:]
+            csv_source = StringIO(csv_source)
+
         try:
-            reader = csv.DictReader(StringIO(csv_content))
+            reader = csv.DictReader(csv_source)
+            batch = []
             
             for i, row in enumerate(reader, start=2):  # Start at 2 for header row
                 # Map common column names
                 first_name = (
-                    row.get('First Name') or 
-                    row.get('first_name') or 
+                    row.get('First Name') or
+                    row.get('first_name') or
                     row.get('FirstName') or
-                    row.get('Name', '').split()[0] if row.get('Name') else ''
+                    (row.get('Name', '').split()[0] if row.get('Name') else '')
                 )
                 
                 if not first_name:
@@ -206,44 +319,100 @@ class ContactService:
                     row.get('E-mail')
                 )
                 
-                # Check for duplicate
-                if email and self.get_by_email(email):
-                    errors.append(f"Row {i}: Email {email} already exists")
-                    continue
-                
-                try:
-                    self.create(
-                        first_name=first_name.strip(),
-                        last_name=last_name.strip() if last_name else None,
-                        email=email.strip() if email else None,
-                        company=(row.get('Company') or row.get('company') or '').strip() or None,
-                        job_title=(row.get('Job Title') or row.get('job_title') or row.get('Title') or '').strip() or None,
-                        city=(row.get('Business City') or row.get('city') or row.get('City') or '').strip() or None,
-                        state=(row.get('Business State') or row.get('state') or row.get('State') or '').strip() or None,
-                        phone=(row.get('Business Phone') or row.get('phone') or row.get('Phone') or '').strip() or None,
-                    )
-                    imported += 1
-                except Exception as e:
-                    errors.append(f"Row {i}: {str(e)}")
-                    
+                batch.append((i, {
+                    'user_id': self.user.id,
+                    'first_name': first_name.strip(),
+                    'last_name': last_name.strip() if last_name else None,
+                    'email': email.strip().lower() if email else None,
+                    'company': (row.get('Company') or row.get('company') or '').strip() or None,
+                    'job_title': (row.get('Job Title') or row.get('job_title') or row.get('Title') or '').strip() or None,
+                    'city': (row.get('Business City') or row.get('city') or row.get('City') or '').strip() or None,
+                    'state': (row.get('Business State') or row.get('state') or row.get('State') or '').strip() or None,
+                    'phone': (row.get('Business Phone') or row.get('phone') or row.get('Phone') or '').strip() or None,
+                }))
+                if len(batch) >= self.IMPORT_BATCH_SIZE:
+                    imported += self._flush_import_batch(batch, errors)
+
+            imported += self._flush_import_batch(batch, errors)
+
         except Exception as e:
             errors.append(f"CSV parsing error: {str(e)}")
         
         return imported, errors
+
+    def _flush_import_batch(self, batch: list, errors: list[str]) -> int:
+        """Insert and commit one import batch, deduplicating against the
+        DB and the batch itself with a single IN query; returns rows
+        inserted. Each batch commits on its own so a failure only loses
+        the failing batch, not the ones already imported."""
+        if not batch:
+            return 0
+
+        emails = [m['email'] for _, m in batch if m['email']]
+        existing = set()
+        if emails:
+            existing = {
+                e for (e,) in self.db.query(Contact.email).filter(
+                    Contact.user_id == self.user.id,
+                    Contact.email.in_(emails),
+                )
+            }
+
+        rows = []
+        seen = set()
+        for line_no, mapping in batch:
+            email = mapping['email']
+            if email and (email in existing or email in seen):
+                errors.append(f"Row {line_no}: Email {email} already exists")
+                continue
+            if email:
+                seen.add(email)
+            rows.append(mapping)
+
+        if rows:
+            try:
+                self.db.bulk_insert_mappings(Contact, rows)
+                # Commit, don't just flush: a rollback on a later batch
+                # would otherwise discard every earlier batch of this
+                # import while the imported count still reported them.
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                errors.append(
+                    f"Rows {batch[0][0]}-{batch[-1][0]}: batch insert failed: {e}"
+                )
+                rows = []
+
+        batch.clear()
+        return len(rows)
     
-    def export_to_csv(self) -> str:
-        """Export all contacts to CSV format."""
-        contacts = self.get_all(limit=10000)
-        
-        output = StringIO()
-        fieldnames = [
-            'First Name', 'Last Name', 'Email Address', 'Company', 
-            'Job Title', 'City', 'State', 'Phone', 'Status', 'Notes'
-        ]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
+    EXPORT_FIELDNAMES = [
+        'First Name', 'Last Name', 'Email Address', 'Company',
+        'Job Title', 'City', 'State', 'Phone', 'Status', 'Notes'
+    ]
+
+    def iter_csv_rows(self):
+        """Yield the contact export as CSV chunks (header, then rows).
+
+        Streams straight from the database: yield_per keeps the session's
+        identity map bounded, so memory stays O(row) however many
+        contacts the user has, and the first byte goes out before the
+        last row is fetched.
+        """
+        buf = StringIO()
+        writer = csv.DictWriter(buf, fieldnames=self.EXPORT_FIELDNAMES)
         writer.writeheader()
-        
-        for contact in contacts:
+        yield buf.getvalue()
+
+        query = (
+            self.db.query(Contact)
+            .filter(Contact.user_id == self.user.id)
+            .order_by(Contact.created_at.desc())
+            .yield_per(500)
+        )
+        for contact in query:
+            buf.seek(0)
+            buf.truncate()
             writer.writerow({
                 'First Name': contact.first_name,
                 'Last Name': contact.last_name or '',
@@ -256,34 +425,33 @@ class ContactService:
                 'Status': contact.status,
                 'Notes': contact.notes or '',
             })
-        
-        return output.getvalue()
+            yield buf.getvalue()
+
+    def export_to_csv(self) -> str:
+        """Export all contacts to CSV format (materialized string)."""
+        return ''.join(self.iter_csv_rows())
     
     def get_stats(self) -> dict:
         """Get contact statistics for the current user."""
-        total = self.get_count()
-        
-        # Count by status
-        from sqlalchemy import func
-        status_counts = (
-            self.db.query(Contact.status, func.count(Contact.id))
+        # One grouped scan instead of three queries (total, by-status,
+        # with-email): count rows and email-bearing rows per status, then
+        # derive the totals in Python
+        rows = (
+            self.db.query(
+                Contact.status,
+                func.count(Contact.id),
+                func.count(case((Contact.email != '', 1))),
+            )
             .filter(Contact.user_id == self.user.id)
             .group_by(Contact.status)
             .all()
         )
-        
-        stats = {
+
+        total = sum(count for _, count, _ in rows)
+        with_email = sum(emails for _, _, emails in rows)
+        return {
             'total': total,
-            'by_status': {status: count for status, count in status_counts},
+            'by_status': {status: count for status, count, _ in rows},
+            'with_email': with_email,
+            'without_email': total - with_email,
         }
-        
-        # Contacts with email vs without
-        with_email = (
-            self.db.query(Contact)
-            .filter(Contact.user_id == self.user.id, Contact.email.isnot(None), Contact.email != '')
-            .count()
-        )
-        stats['with_email'] = with_email
-        stats['without_email'] = total - with_email
-        
-        return stats
@@ -4,10 +4,12 @@ Email generation and sending service.
 Handles AI-powered email generation and delivery.
 """
 
-import json
 import logging
+import time
 from datetime import datetime
 from typing import Optional, Any
+
+import orjson
 from sqlalchemy.orm import Session
 
 from openai import OpenAI
@@ -20,6 +22,31 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# Per-user contacted-email sets with a short TTL. Endpoints that need the
+# aggregate (logs, stats, legacy listings) otherwise rebuild the set from
+# an EmailLog scan on every request; sends invalidate eagerly so a fresh
+# send is visible immediately. Same shape as the auth-token cache.
+_CONTACTED_CACHE_TTL_SECONDS = 60
+_CONTACTED_CACHE_MAX_ENTRIES = 1024
+_contacted_cache: dict[int, tuple[float, frozenset]] = {}
+
+# One OpenAI client for the whole process. The client keeps an HTTP
+# connection pool, so sharing it preserves warm TLS connections across
+# requests; per-service construction threw that pool away every request.
+_openai_client: Optional[OpenAI] = None
+
+
+def _shared_openai_client() -> OpenAI:
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
+    return _openai_client
+
+
+def _invalidate_contacted_cache(user_id: int) -> None:
+    """Drop a user's cached contacted set (called after logging a send)."""
+    _contacted_cache.pop(user_id, None)
+
 
 # ========================================
 # Email Quality Validation
@@ -97,7 +124,7 @@ class EmailService:
     def __init__(self, db: Session, user: User):
         self.db = db
         self.user = user
-        self.openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
+        self.openai_client = _shared_openai_client()
     
     def _get_user_profile_dict(self) -> dict:
         """Get user profile as a dictionary for template rendering."""
@@ -205,6 +232,8 @@ class EmailService:
         
         # Call OpenAI
         try:
+            # json_object mode makes the API guarantee parseable JSON,
+            # so no markdown-fence cleanup is needed on the way out
             response = self.openai_client.chat.completions.create(
                 model=config.OPENAI_MODEL,
                 messages=[
@@ -212,22 +241,14 @@ class EmailService:
                     {"role": "user", "content": user_prompt},
                 ],
                 temperature=config.OPENAI_TEMPERATURE,
+                response_format={"type": "json_object"},
             )
             
             content = response.choices[0].message.content
             if not content:
                 raise ValueError("Empty response from OpenAI")
             
-            content = content.strip()
-            
-            # Clean markdown code fences if present
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                content = content.strip()
-            
-            data = json.loads(content)
+            data = orjson.loads(content)
             
             # Handle list response
             if isinstance(data, list):
@@ -293,6 +314,7 @@ class EmailService:
         )
         self.db.add(log)
         self.db.flush()
+        _invalidate_contacted_cache(self.user.id)
         return log
     
     def get_logs(
@@ -308,9 +330,43 @@ class EmailService:
             query = query.filter(EmailLog.status == status)
         
         return query.order_by(EmailLog.created_at.desc()).offset(skip).limit(limit).all()
+
+    # Columns returned by get_log_rows, in order
+    LOG_COLUMNS = (
+        EmailLog.id, EmailLog.created_at, EmailLog.recipient_email,
+        EmailLog.recipient_name, EmailLog.company, EmailLog.subject,
+        EmailLog.status, EmailLog.error_message,
+    )
+
+    def get_log_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[EmailStatus] = None,
+    ) -> list[tuple]:
+        """
+        Like get_logs, but returns plain column tuples (see LOG_COLUMNS)
+        instead of ORM instances - the listing endpoint only serializes
+        them, so there is no reason to pay for identity-map bookkeeping
+        per row.
+        """
+        query = self.db.query(*self.LOG_COLUMNS).filter(EmailLog.user_id == self.user.id)
+
+        if status:
+            query = query.filter(EmailLog.status == status)
+
+        return query.order_by(EmailLog.created_at.desc()).offset(skip).limit(limit).all()
     
-    def get_contacted_emails(self) -> set[str]:
-        """Get set of email addresses that have been contacted."""
+    def get_contacted_emails(self) -> frozenset:
+        """Get set of email addresses that have been contacted.
+
+        Served from a short-TTL per-user cache; log_email invalidates it
+        so a just-sent address is never reported as uncontacted.
+        """
+        entry = _contacted_cache.get(self.user.id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
         logs = (
             self.db.query(EmailLog.recipient_email)
             .filter(
@@ -320,42 +376,38 @@ class EmailService:
             .distinct()
             .all()
         )
-        return {log[0].lower() for log in logs if log[0]}
+        contacted = frozenset(log[0].lower() for log in logs if log[0])
+
+        if len(_contacted_cache) >= _CONTACTED_CACHE_MAX_ENTRIES:
+            # Evict expired entries; clear outright if everything is live
+            now = time.monotonic()
+            expired = [uid for uid, (exp, _) in _contacted_cache.items() if exp <= now]
+            for uid in expired:
+                del _contacted_cache[uid]
+            if len(_contacted_cache) >= _CONTACTED_CACHE_MAX_ENTRIES:
+                _contacted_cache.clear()
+        _contacted_cache[self.user.id] = (
+            time.monotonic() + _CONTACTED_CACHE_TTL_SECONDS, contacted
+        )
+        return contacted
     
     def get_stats(self) -> dict:
         """Get email statistics for the current user."""
         from sqlalchemy import func
-        
-        total_sent = (
-            self.db.query(EmailLog)
-            .filter(
-                EmailLog.user_id == self.user.id,
-                EmailLog.status == EmailStatus.SENT
-            )
-            .count()
-        )
-        
-        total_failed = (
-            self.db.query(EmailLog)
-            .filter(
-                EmailLog.user_id == self.user.id,
-                EmailLog.status == EmailStatus.FAILED
-            )
-            .count()
-        )
-        
-        total_drafts = (
-            self.db.query(EmailLog)
-            .filter(
-                EmailLog.user_id == self.user.id,
-                EmailLog.status == EmailStatus.DRAFT
-            )
-            .count()
+
+        # Single grouped count instead of one COUNT(*) query per status
+        counts = dict(
+            self.db.query(EmailLog.status, func.count(EmailLog.id))
+            .filter(EmailLog.user_id == self.user.id)
+            .group_by(EmailLog.status)
+            .all()
         )
-        
+
+        total_sent = counts.get(EmailStatus.SENT, 0)
+        total_failed = counts.get(EmailStatus.FAILED, 0)
         return {
             "sent": total_sent,
             "failed": total_failed,
-            "drafts": total_drafts,
+            "drafts": counts.get(EmailStatus.DRAFT, 0),
             "success_rate": round(total_sent / (total_sent + total_failed) * 100, 1) if (total_sent + total_failed) > 0 else 0,
         }
@@ -291,6 +291,24 @@ class TestAPIIntegration:
         
         assert response.status_code == 401
     
+    def test_save_config_rejects_non_json(self, client):
+        """Test invalid config saves return 400 and leave the file alone."""
+        from api_server import DEFAULT_CONFIG_FILE
+        with open(DEFAULT_CONFIG_FILE, 'rb') as f:
+            before = f.read()
+
+        # Wrong content type
+        response = client.post('/api/config', data='not json')
+        assert response.status_code == 400
+
+        # Right content type, malformed body
+        response = client.post('/api/config', data='{not json',
+                               content_type='application/json')
+        assert response.status_code == 400
+
+        with open(DEFAULT_CONFIG_FILE, 'rb') as f:
+            assert f.read() == before
+
     def test_register_validation(self, client):
         """Test registration validation."""
         # Missing email
@@ -423,6 +441,59 @@ class TestContactService:
         assert result == True
         assert service.get_by_id(contact_id) is None
     
+    def test_get_page_cursor_round_trip(self, db_session, test_user):
+        """Test keyset pagination: disjoint pages and a stable total."""
+        import base64
+        from datetime import datetime
+
+        import orjson
+
+        from outreach_proj.services.contact_service import ContactService
+
+        service = ContactService(db_session, test_user)
+        tag = uuid.uuid4().hex[:8]
+        for i in range(5):
+            service.create(first_name=f"Page{i}", email=f'page{i}_{tag}@test.com')
+
+        rows, total = service.get_page(limit=3)
+        assert len(rows) == 3
+        assert total == 5
+
+        # Round-trip the cursor exactly the way get_contacts encodes it
+        last = rows[-1]
+        token = base64.urlsafe_b64encode(
+            orjson.dumps([last.created_at, last.id])
+        ).decode('ascii')
+        created_s, last_id = orjson.loads(base64.urlsafe_b64decode(token))
+        after = (datetime.fromisoformat(created_s), last_id)
+
+        rows2, total2 = service.get_page(limit=3, after=after)
+
+        assert len(rows2) == 2
+        assert total2 == 5
+        assert {r.id for r in rows}.isdisjoint({r.id for r in rows2})
+
+    def test_import_from_csv(self, db_session, test_user):
+        """Test importing contacts from a First Name-headed CSV."""
+        from outreach_proj.services.contact_service import ContactService
+
+        service = ContactService(db_session, test_user)
+
+        tag = uuid.uuid4().hex[:8]
+        csv_content = (
+            "First Name,Last Name,Email Address,Company\n"
+            f"Alice,Anders,alice_{tag}@test.com,Acme\n"
+            f"Bob,Brown,bob_{tag}@test.com,Biz\n"
+        )
+
+        imported, errors = service.import_from_csv(csv_content)
+
+        assert imported == 2
+        assert errors == []
+        alice = service.get_by_email(f'alice_{tag}@test.com')
+        assert alice is not None
+        assert alice.first_name == "Alice"
+
     def test_contacts_are_user_scoped(self, db_session, test_user):
         """Test that contacts are scoped to user."""
         from outreach_proj.services.contact_service import ContactService